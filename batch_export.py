@@ -0,0 +1,117 @@
+import os
+import re
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from sheet_layout import DEFAULT_LAYOUT
+from spell_database import SPELL_DATA_FILE
+
+# Outcome of one sheet: error is None on success, otherwise a message and
+# no file is left behind at path
+ExportResult = namedtuple("ExportResult", ["index", "name", "path", "error"])
+
+UNSAFE_FILENAME_CHARS = re.compile(r"[^\w\-]+")
+
+# Per-process renderer, created once by _init_worker
+_worker = None
+
+
+def safe_file_stem(name):
+    """Filesystem-safe file stem for a character name"""
+    stem = UNSAFE_FILENAME_CHARS.sub("_", str(name)).strip("_")
+    return stem[:100] or "Character"
+
+
+def reserve_output_file(output_dir, name):
+    """Atomically claim an unused "<name>.pdf", "<name>-2.pdf", ... in output_dir.
+
+    The empty file is created with O_EXCL, so names never collide with
+    existing files, other sheets of the batch or a concurrent export.
+    """
+    stem = safe_file_stem(name)
+    suffix = 1
+    while True:
+        path = output_dir / (f"{stem}.pdf" if suffix == 1 else f"{stem}-{suffix}.pdf")
+        try:
+            os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return path
+        except FileExistsError:
+            suffix += 1
+
+
+def _init_worker(spell_data_file, cache_dir, layout):
+    """Load the renderer and spell database once per worker process"""
+    global _worker
+    from pdf_generator import PDFGenerator
+    from spell_database import load_spell_database
+    _worker = (PDFGenerator(cache_dir, layout=layout), load_spell_database(spell_data_file))
+
+
+def _render_one(index, data, path):
+    """Render one sheet in a worker, reporting failures instead of raising"""
+    generator, spell_database = _worker
+    try:
+        generator.write_sheet(data, path, spell_database)
+        return ExportResult(index, data.get("Name", "Character"), str(path), None)
+    except Exception as e:
+        return _failed(index, data, path, f"{type(e).__name__}: {e}")
+
+
+def _failed(index, data, path, error):
+    """Drop the reserved file of a sheet that could not be rendered"""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+    return ExportResult(index, data.get("Name", "Character"), str(path), error)
+
+
+def export_batch(characters, output_dir="exports", workers=None, progress=None,
+                 spell_data_file=SPELL_DATA_FILE, cache_dir=None, layout=DEFAULT_LAYOUT):
+    """Render one PDF per character dict, spread across a process pool.
+
+    Sheets are written to output_dir under collision-free names derived
+    from the character names. workers defaults to the CPU count; with one
+    worker everything runs in this process. progress, if given, is called
+    as progress(done, total, result) after every sheet. Returns the list of
+    ExportResults in input order; a failing sheet never stops the batch.
+    With a cache_dir, unchanged sheets are copied from the render cache.
+    layout names the sheet layout in layouts/ to render with.
+    """
+    characters = list(characters)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    total = len(characters)
+    paths = [reserve_output_file(output_dir, data.get("Name", "Character")) for data in characters]
+    results = [None] * total
+    done = 0
+
+    def record(result):
+        nonlocal done
+        results[result.index] = result
+        done += 1
+        if progress:
+            progress(done, total, result)
+
+    if workers == 1 or total <= 1:
+        _init_worker(spell_data_file, cache_dir, layout)
+        for index, (data, path) in enumerate(zip(characters, paths)):
+            record(_render_one(index, data, path))
+        return results
+
+    with ProcessPoolExecutor(max_workers=min(workers, total), initializer=_init_worker,
+                             initargs=(spell_data_file, cache_dir, layout)) as executor:
+        futures = {executor.submit(_render_one, index, data, path): index
+                   for index, (data, path) in enumerate(zip(characters, paths))}
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker died, or the sheet could not be sent to it
+                result = _failed(index, characters[index], paths[index], f"{type(e).__name__}: {e}")
+            record(result)
+
+    return results
@@ -0,0 +1,78 @@
+import numpy as np
+
+from character_model import ATTRIBUTE_BASE, ATTRIBUTE_NAMES, CharacterModel, health_points
+
+# Input columns expected by compute_derived_stats
+INPUT_COLUMNS = ATTRIBUTE_NAMES + ["Level"]
+
+# Derived columns shared with CharacterModel.get_character_data
+MODEL_COLUMNS = [
+    "Prime", "Combat Mastery", "Save DC", "Grit Points", "Initiative",
+    "To Hit (Melee)", "To Hit (Ranged)", "Spell Check", "Skill Slots (INT + 2)"
+]
+
+
+def columns_from_characters(characters):
+    """Convert an iterable of character dicts into the input columns as int arrays"""
+    rows = [[int(data.get(name, ATTRIBUTE_BASE)) for name in ATTRIBUTE_NAMES] + [int(data.get("Level", 1))]
+            for data in characters]
+    table = np.array(rows, dtype=np.int64).reshape(-1, len(INPUT_COLUMNS))
+    return {name: table[:, i] for i, name in enumerate(INPUT_COLUMNS)}
+
+
+def compute_derived_stats(columns):
+    """Compute every derived stat for a whole roster at once.
+
+    Takes a mapping of Might, Agility, Charisma, Intelligence and Level to
+    equal-length integer arrays and returns a dict of derived arrays keyed like
+    CharacterModel.get_character_data, plus "Health Points" as drawn on the sheet.
+    """
+    might, agility, charisma, intelligence, level = (
+        np.asarray(columns[name], dtype=np.int64) for name in INPUT_COLUMNS
+    )
+
+    prime = np.maximum(np.maximum(might, agility), np.maximum(charisma, intelligence))
+    # ceil(level / 2) in integer arithmetic
+    combat_mastery = (level + 1) // 2
+
+    return {
+        "Prime": prime,
+        "Combat Mastery": combat_mastery,
+        "Save DC": 10 + combat_mastery + prime,
+        "Grit Points": charisma + 2,
+        "Initiative": combat_mastery + agility,
+        "To Hit (Melee)": combat_mastery + might,
+        "To Hit (Ranged)": combat_mastery + agility,
+        "Spell Check": combat_mastery + prime,
+        "Skill Slots (INT + 2)": intelligence + 2,
+        "Health Points": health_points(level, might),
+    }
+
+
+def validate_against_model(columns, derived=None, sample_size=1000, seed=0):
+    """Check batch results against CharacterModel for a random sample of rows.
+
+    Returns a list of (row, column, expected, actual) mismatches, empty when
+    the vectorized formulas agree with the per-character model.
+    """
+    if derived is None:
+        derived = compute_derived_stats(columns)
+
+    count = len(columns["Level"])
+    rng = np.random.default_rng(seed)
+    rows = np.arange(count) if count <= sample_size else rng.choice(count, sample_size, replace=False)
+
+    mismatches = []
+    model = CharacterModel()
+    for row in rows:
+        for name in ATTRIBUTE_NAMES:
+            model.attributes[name] = int(columns[name][row])
+        model.level = int(columns["Level"][row])
+        expected = model.get_character_data()
+        expected["Health Points"] = health_points(model.level, model.attributes["Might"])
+
+        for column in MODEL_COLUMNS + ["Health Points"]:
+            actual = int(derived[column][row])
+            if actual != expected[column]:
+                mismatches.append((int(row), column, expected[column], actual))
+    return mismatches
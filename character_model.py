@@ -0,0 +1,376 @@
+import math
+import operator
+import re
+from functools import lru_cache
+
+from dependency_graph import DependencyCache, DependencyGraph
+from inventory_parser import InventoryMatcher
+
+# DC20 rules tables shared by the headless model and the Tk binding layer
+ATTRIBUTE_BASE = -2
+ATTRIBUTE_POOL = 12
+ATTRIBUTE_NAMES = ["Might", "Agility", "Charisma", "Intelligence"]
+
+SKILL_NAMES = [
+    ("Athletics", "Might"),
+    ("Intimidation", "Might"),
+    ("Acrobatics", "Agility"),
+    ("Trickery", "Agility"),
+    ("Stealth", "Agility"),
+    ("Animal", "Charisma"),
+    ("Influence", "Charisma"),
+    ("Insight", "Charisma"),
+    ("Investigation", "Intelligence"),
+    ("Medicine", "Intelligence"),
+    ("Survival", "Intelligence")
+]
+
+TRAINING_BONUS = {"None": 0, "Trained": 1, "Expert": 2}
+TRAINING_SLOT_COST = {"Trained": 1, "Expert": 2}
+
+# Skills were once saved as "Name: value (Training), ..." strings
+LEGACY_SKILL_PATTERN = re.compile(r"([^:,]+):\s*(-?\d+)\s*\(([^)]*)\)")
+
+INVENTORY_PRESETS = {
+    "Fighter": "Longsword, Shield, Chain Mail, Backpack",
+    "Rogue": "Dagger, Thieves' Tools, Leather Armor, Cloak",
+    "Wizard": "Spellbook, Wand, Robes, Arcane Focus",
+    "Cleric": "Mace, Holy Symbol, Chain Shirt, Healing Kit",
+    "Hunter": "Bow, Hunting Knife, Hide Armor, Traps",
+    "Bard": "Lute, Leather Armor, Charm Kit, Entertainer's Pack",
+}
+
+SPELLCASTING_CLASSES = ["Wizard", "Cleric", "Bard"]
+
+# Spell schools each spellcasting class can learn from
+CLASS_SPELL_SCHOOLS = {
+    "Wizard": ["Evocation", "Transmutation", "Abjuration", "Conjuration", "Illusion"],
+    "Cleric": ["Evocation", "Abjuration", "Divination", "Enchantment"],
+    "Bard": ["Enchantment", "Illusion", "Divination", "Transmutation"],
+}
+
+MAX_SPELL_LEVEL = 3
+
+ARMOR_VALUES = {
+    "robes": 10, "leather armor": 13, "hide armor": 14,
+    "chain shirt": 15, "chain mail": 16, "plate armor": 18, "shield": 2
+}
+
+# Common weapons: name, base damage (None for special), damage attribute, damage type, attack type
+WEAPON_STATS = {
+    "longsword": ("Longsword", 2, "Might", "Slashing", "melee"),
+    "dagger": ("Dagger", 1, "Might", "Piercing", "melee"),
+    "bow": ("Bow", 2, "Agility", "Piercing", "ranged"),
+    "crossbow": ("Crossbow", 2, "Agility", "Piercing", "ranged"),
+    "mace": ("Mace", 2, "Might", "Bludgeoning", "melee"),
+    "wand": ("Wand", None, None, "Force", "spell"),
+    "staff": ("Staff", 1, "Might", "Bludgeoning", "melee"),
+    "hunting knife": ("Hunting Knife", 1, "Might", "Slashing", "melee"),
+    "lute": ("Lute", 1, "Might", "Bludgeoning", "melee"),
+    "sword": ("Sword", 2, "Might", "Slashing", "melee"),
+    "axe": ("Axe", 2, "Might", "Slashing", "melee"),
+    "spear": ("Spear", 2, "Might", "Piercing", "melee"),
+    "club": ("Club", 1, "Might", "Bludgeoning", "melee"),
+    "hammer": ("Hammer", 2, "Might", "Bludgeoning", "melee")
+}
+
+CLASS_DEFAULT_ARMOR = {
+    "Fighter": 16, "Cleric": 15, "Hunter": 14,
+    "Rogue": 14, "Bard": 13, "Wizard": 10
+}
+
+# Compiled once: every armor and weapon phrase, matched as whole words
+ITEM_MATCHER = InventoryMatcher({phrase: phrase for phrase in list(ARMOR_VALUES) + list(WEAPON_STATS)})
+
+
+def get_spell_slots(class_name, level):
+    """Calculate spell slots for a class at given level"""
+    if class_name not in SPELLCASTING_CLASSES:
+        return {}
+
+    # DC20 spell slot progression (simplified)
+    if level == 1:
+        return {0: 3, 1: 2}  # 3 cantrips, 2 first level
+    elif level == 2:
+        return {0: 3, 1: 3}
+    elif level == 3:
+        return {0: 4, 1: 4, 2: 2}
+    elif level == 4:
+        return {0: 4, 1: 4, 2: 3}
+    elif level == 5:
+        return {0: 4, 1: 4, 2: 3, 3: 2}
+    else:
+        return {0: 4, 1: 4, 2: 3, 3: 3}
+
+
+def parse_skills(skills):
+    """Normalize saved skills to {name: {"value": int, "training": str}}.
+
+    Accepts the structured mapping as saved now, or the legacy comma-joined
+    string from older character files.
+    """
+    if isinstance(skills, dict):
+        return skills
+    parsed = {}
+    if skills:
+        for name, value, training in LEGACY_SKILL_PATTERN.findall(skills):
+            parsed[name.strip()] = {"value": int(value), "training": training}
+    return parsed
+
+
+def max_spell_level(level):
+    """Highest spell level available at a character level (DC20 spell progression)"""
+    return min(MAX_SPELL_LEVEL, (level + 1) // 2)
+
+
+def build_spell_index(spell_database):
+    """Precompute sorted available spells keyed by (class, max spell level)"""
+    index = {}
+    for class_name in SPELLCASTING_CLASSES:
+        schools = set(CLASS_SPELL_SCHOOLS[class_name])
+        eligible = [(spell_data["level"], spell_name) for spell_name, spell_data in spell_database.items()
+                    if spell_data["school"] in schools]
+        for max_level in range(MAX_SPELL_LEVEL + 1):
+            index[(class_name, max_level)] = tuple(sorted(
+                spell_name for spell_level, spell_name in eligible if spell_level <= max_level))
+    return index
+
+
+def health_points(level, might):
+    """DC20 health points; also accepts NumPy arrays for batch computation"""
+    return 10 + level * might
+
+
+def parse_inventory(inventory_text):
+    """Structured catalog items with quantities found in inventory text"""
+    return _parse_inventory(inventory_text)
+
+
+@lru_cache(maxsize=4096)
+def _parse_inventory(inventory_text):
+    # Rosters repeat the same preset inventories, so parses are memoized
+    return tuple(ITEM_MATCHER.parse(inventory_text))
+
+
+def calculate_armor_rating(cls, inventory_text):
+    """Armor rating from the best armor in the inventory, or the class default"""
+    base_armor = 0
+    has_shield = False
+    for item in parse_inventory(inventory_text):
+        if item.key == "shield":
+            has_shield = True
+        elif item.key in ARMOR_VALUES:
+            base_armor = max(base_armor, ARMOR_VALUES[item.key])
+    if base_armor == 0:
+        base_armor = CLASS_DEFAULT_ARMOR.get(cls, 12)
+    if has_shield:
+        base_armor += ARMOR_VALUES["shield"]
+    return base_armor
+
+
+def parse_weapons_from_inventory(inventory_text, class_name, might, agility, combat_mastery):
+    """Parse weapons from inventory and return attack data with DC20 mechanics"""
+    weapons = []
+    scores = {"Might": might, "Agility": agility}
+
+    # In DC20, damage typically has a base weapon damage + ability modifier
+    for item in parse_inventory(inventory_text):
+        if item.key in WEAPON_STATS:
+            name, base_damage, attribute, weapon_type, attack_type = WEAPON_STATS[item.key]
+            damage = "Special" if base_damage is None else f"{base_damage + scores[attribute]}"
+            weapons.append((name, damage, weapon_type))
+
+    # Add class-specific abilities if no weapons found or as additional options
+    class_abilities = {
+        "Fighter": ("Combat Strike", f"{2 + might + combat_mastery}", "Physical"),
+        "Rogue": ("Precision Strike", f"{1 + agility + combat_mastery}", "Piercing"),
+        "Wizard": ("Cantrip", "1d4", "Magical"),
+        "Cleric": ("Divine Strike", f"{1 + might + combat_mastery}", "Radiant"),
+        "Hunter": ("Aimed Shot", f"{2 + agility + combat_mastery}", "Piercing"),
+        "Bard": ("Inspiring Strike", f"{1 + might}", "Physical")
+    }
+
+    if class_name in class_abilities and len(weapons) < 3:
+        weapons.append(class_abilities[class_name])
+
+    # Always add unarmed strike with base damage
+    weapons.append(("Unarmed Strike", f"{1 + might}", "Bludgeoning"))
+
+    return weapons[:4]  # Limit to 4 attacks to fit the table
+
+
+def _build_formulas():
+    """Dependency graph of every derived stat over the model's inputs"""
+    graph = DependencyGraph()
+    graph.add_derived("prime", ATTRIBUTE_NAMES, lambda *scores: max(scores))
+    # Combat Mastery is level / 2 rounded UP
+    graph.add_derived("combat_mastery", ["level"], lambda level: math.ceil(int(level) / 2))
+    graph.add_derived("save_dc", ["combat_mastery", "prime"], lambda cm, prime: 10 + cm + prime)
+    graph.add_derived("grit", ["Charisma"], lambda charisma: charisma + 2)
+    graph.add_derived("initiative", ["combat_mastery", "Agility"], operator.add)
+    graph.add_derived("melee_hit", ["combat_mastery", "Might"], operator.add)
+    graph.add_derived("ranged_hit", ["combat_mastery", "Agility"], operator.add)
+    graph.add_derived("spell_check", ["combat_mastery", "prime"], operator.add)
+    graph.add_derived("armor_rating", ["class_name", "inventory"], calculate_armor_rating)
+    graph.add_derived("skill_slots", ["Intelligence"], lambda intelligence: intelligence + 2)
+    graph.add_derived("points_remaining", ATTRIBUTE_NAMES,
+                      lambda *scores: ATTRIBUTE_POOL - sum(score - ATTRIBUTE_BASE for score in scores))
+    for name, attr in SKILL_NAMES:
+        graph.add_derived("skill:" + name, [attr, "training:" + name],
+                          lambda score, training: score + TRAINING_BONUS[training])
+    graph.add_derived("used_skill_slots", ["training:" + name for name, _ in SKILL_NAMES],
+                      lambda *trainings: sum(TRAINING_SLOT_COST.get(t, 0) for t in trainings))
+    graph.add_derived("remaining_skill_slots", ["skill_slots", "used_skill_slots"], operator.sub)
+    graph.add_derived("spell_slots", ["class_name", "level"],
+                      lambda class_name, level: get_spell_slots(class_name, int(level)))
+    return graph
+
+
+CHARACTER_FORMULAS = _build_formulas()
+
+
+class _InputMap(dict):
+    """Dict of model inputs whose writes invalidate dependent derived values"""
+
+    __slots__ = ("_values", "_prefix")
+
+    def __init__(self, values, prefix, items):
+        super().__init__(items)
+        self._values = values
+        self._prefix = prefix
+        for key, value in items.items():
+            values.set(prefix + key, value)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._values.set(self._prefix + key, value)
+
+
+def _input(name):
+    """Model attribute stored as a dependency-graph input"""
+    return property(lambda self: self._values.get(name),
+                    lambda self, value: self._values.set(name, value))
+
+
+def _derived(name, doc=None):
+    """Read-only model attribute served from the dependency cache"""
+    return property(lambda self: self._values.get(name), doc=doc)
+
+
+class CharacterModel:
+    """Plain-Python DC20 character with all derived-stat logic.
+
+    Has no Tk dependency, so batch jobs and servers can build and compute
+    characters without a display. CharacterData binds its Tk variables to one
+    of these. Derived stats are cached and recomputed only when an input they
+    depend on changes.
+    """
+
+    __slots__ = ("name", "player_name", "ancestry", "background", "subclass",
+                 "attributes", "skill_trainings", "selected_spells", "_values")
+
+    _SKILL_KEYS = [(name, "skill:" + name) for name, _ in SKILL_NAMES]
+
+    class_name = _input("class_name")
+    level = _input("level")  # int, or a numeric string as held by the level combobox
+    inventory = _input("inventory")
+
+    prime = _derived("prime")
+    combat_mastery = _derived("combat_mastery")
+    save_dc = _derived("save_dc")
+    grit = _derived("grit")
+    initiative = _derived("initiative")
+    armor_rating = _derived("armor_rating")
+    skill_slots = _derived("skill_slots")
+    points_remaining = _derived("points_remaining")
+    remaining_skill_slots = _derived("remaining_skill_slots",
+                                     "Skill slots left after trainings; negative when overspent")
+
+    def __init__(self):
+        self._values = DependencyCache(CHARACTER_FORMULAS, {"class_name": "", "level": 1, "inventory": ""})
+        self.name = ""
+        self.player_name = ""
+        self.ancestry = ""
+        self.background = ""
+        self.subclass = ""
+        self.attributes = _InputMap(self._values, "", {name: ATTRIBUTE_BASE for name in ATTRIBUTE_NAMES})
+        self.skill_trainings = _InputMap(self._values, "training:", {name: "None" for name, _ in SKILL_NAMES})
+        self.selected_spells = []
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a model from a saved character dictionary"""
+        model = cls()
+        model.load_character_data(data)
+        return model
+
+    def is_spellcaster(self):
+        """Check if current class is a spellcaster"""
+        return self.class_name in SPELLCASTING_CLASSES
+
+    def update_attributes(self, attr_name, delta):
+        """Spend or refund attribute points; returns False if the pool doesn't allow it"""
+        total_spent = ATTRIBUTE_POOL - self.points_remaining
+        if 0 <= (total_spent + delta) <= ATTRIBUTE_POOL:
+            self.attributes[attr_name] += delta
+            return True
+        return False
+
+    def calculate_skills(self):
+        """Skill values as attribute score plus training bonus"""
+        get = self._values.get
+        return {name: get(key) for name, key in self._SKILL_KEYS}
+
+    def get_character_data(self):
+        """Get all character data as a dictionary"""
+        get = self._values.get
+        level = int(self.level)
+        skills = self.calculate_skills()
+
+        return {
+            "Name": self.name,
+            "Player Name": self.player_name,
+            "Ancestry": self.ancestry,
+            "Background": self.background,
+            "Class": self.class_name,
+            "Subclass": self.subclass,
+            "Level": level,
+            "Might": self.attributes["Might"],
+            "Agility": self.attributes["Agility"],
+            "Charisma": self.attributes["Charisma"],
+            "Intelligence": self.attributes["Intelligence"],
+            "Prime": get("prime"),
+            "Combat Mastery": get("combat_mastery"),
+            "Save DC": get("save_dc"),
+            "Grit Points": get("grit"),
+            "Initiative": get("initiative"),
+            "To Hit (Melee)": get("melee_hit"),
+            "To Hit (Ranged)": get("ranged_hit"),
+            "Spell Check": get("spell_check"),
+            "Armor Rating": get("armor_rating"),
+            "Skill Slots (INT + 2)": get("skill_slots"),
+            "Inventory": self.inventory or INVENTORY_PRESETS.get(self.class_name, ""),
+            "Skills": {k: {"value": v, "training": self.skill_trainings[k]} for k, v in skills.items()},
+            "Selected Spells": self.selected_spells,
+            "Spell Slots": dict(get("spell_slots"))
+        }
+
+    def load_character_data(self, data):
+        """Load character data from dictionary"""
+        self.name = data.get("Name", "")
+        self.player_name = data.get("Player Name", "")
+        self.ancestry = data.get("Ancestry", "")
+        self.background = data.get("Background", "")
+        self.class_name = data.get("Class", "")
+        self.subclass = data.get("Subclass", "")
+        self.level = data.get("Level", 1)
+        self.inventory = data.get("Inventory", "")
+
+        for name in ATTRIBUTE_NAMES:
+            self.attributes[name] = data.get(name, ATTRIBUTE_BASE)
+
+        self.selected_spells = data.get("Selected Spells", [])
+
+        for skill_name, skill in parse_skills(data.get("Skills")).items():
+            if skill_name in self.skill_trainings:
+                self.skill_trainings[skill_name] = skill["training"]
@@ -0,0 +1,193 @@
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk
+
+from name_index import NameIndex
+
+# How often streamed scan results are drained into the list, in milliseconds
+POLL_INTERVAL_MS = 50
+
+
+class CharacterPicker(ttk.Frame):
+    """Searchable list of saved characters that stays responsive for huge rosters.
+
+    The Listbox only ever holds the visible rows: scrolling moves a window
+    over the range of the NameIndex that matches the typed prefix. The
+    roster is scanned on a background thread and streamed in batch by
+    batch, so the list fills while the user is already typing.
+    """
+
+    def __init__(self, master, rows=8, width=30, on_activate=None):
+        super().__init__(master)
+        self.rows = rows
+        self.on_activate = on_activate
+        self.index = NameIndex()
+        self.filter_var = tk.StringVar()
+        self._prefix = ""
+        # Index positions matching the filter, and the first of them shown
+        self._start = self._stop = 0
+        self._top = 0
+        self._selected = None
+        self._scan_id = 0
+        self._scanning = False
+        self._batches = queue.Queue()
+        self._poll_job = None
+
+        filter_frame = ttk.Frame(self)
+        filter_frame.pack(fill="x")
+        ttk.Label(filter_frame, text="Search:").pack(side="left")
+        filter_entry = ttk.Entry(filter_frame, textvariable=self.filter_var)
+        filter_entry.pack(side="left", fill="x", expand=True, padx=5)
+        self.status = ttk.Label(filter_frame, text="", foreground="gray")
+        self.status.pack(side="left")
+
+        list_frame = ttk.Frame(self)
+        list_frame.pack(fill="both", expand=True, pady=2)
+        self.scrollbar = ttk.Scrollbar(list_frame, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.listbox = tk.Listbox(list_frame, height=rows, width=width, exportselection=False,
+                                  activestyle="none")
+        self.listbox.pack(side="left", fill="both", expand=True)
+
+        self.filter_var.trace_add("write", lambda *args: self._on_filter())
+        self.listbox.bind("<<ListboxSelect>>", self._on_select)
+        self.listbox.bind("<Double-Button-1>", lambda e: self._activate())
+        self.listbox.bind("<Return>", lambda e: self._activate())
+        self.listbox.bind("<Up>", lambda e: self._move_selection(-1))
+        self.listbox.bind("<Down>", lambda e: self._move_selection(1))
+        self.listbox.bind("<MouseWheel>", lambda e: self._scroll(-1 if e.delta > 0 else 1))
+        self.listbox.bind("<Button-4>", lambda e: self._scroll(-1))
+        self.listbox.bind("<Button-5>", lambda e: self._scroll(1))
+        filter_entry.bind("<Down>", lambda e: self.listbox.focus_set())
+        filter_entry.bind("<Return>", lambda e: self._activate())
+
+    def selection(self):
+        """The selected (name, ref) pair, or None"""
+        return self._selected
+
+    def start_scan(self, source):
+        """Replace the list with the batches yielded by source() on a background thread.
+
+        source must be safe to call off the main thread, e.g. a store's
+        iter_available_characters.
+        """
+        self._scan_id += 1
+        self._scanning = True
+        self.index = NameIndex()
+        self._selected = None
+        self._refresh_matches()
+        threading.Thread(target=self._scan, args=(self._scan_id, source), daemon=True).start()
+        if self._poll_job is None:
+            self._poll_job = self.after(POLL_INTERVAL_MS, self._poll)
+
+    def _scan(self, scan_id, source):
+        """Background thread: queue each batch from source, then an end marker"""
+        try:
+            for batch in source():
+                self._batches.put((scan_id, batch))
+        except Exception as e:
+            print(f"Error scanning characters: {e}")
+        self._batches.put((scan_id, None))
+
+    def _poll(self):
+        """Main thread: add every batch that arrived since the last poll in one step"""
+        self._poll_job = None
+        items = []
+        while True:
+            try:
+                scan_id, batch = self._batches.get_nowait()
+            except queue.Empty:
+                break
+            if scan_id != self._scan_id:
+                continue  # From a scan that was restarted
+            if batch is None:
+                self._scanning = False
+            else:
+                items.extend(batch)
+
+        if items:
+            self.index.add_batch(items)
+            self._refresh_matches()
+        elif not self._scanning:
+            self._update_status()
+        if self._scanning:
+            self._poll_job = self.after(POLL_INTERVAL_MS, self._poll)
+
+    def _refresh_matches(self):
+        """Recompute the matching range after the index changed"""
+        self._start, self._stop = self.index.prefix_range(self._prefix)
+        self._render()
+
+    def _on_filter(self):
+        prefix = self.filter_var.get()
+        if self._prefix and prefix.startswith(self._prefix):
+            self._start, self._stop = self.index.prefix_range(prefix, self._start, self._stop)
+        else:
+            self._start, self._stop = self.index.prefix_range(prefix)
+        self._prefix = prefix
+        self._top = 0
+        self._render()
+
+    def _render(self):
+        """Fill the Listbox with the visible window of matches"""
+        count = self._stop - self._start
+        self._top = max(0, min(self._top, count - self.rows))
+        first = self._start + self._top
+        last = min(first + self.rows, self._stop)
+
+        self.listbox.delete(0, tk.END)
+        for position in range(first, last):
+            self.listbox.insert(tk.END, self.index[position][0])
+            if self.index[position] == self._selected:
+                self.listbox.selection_set(position - first)
+
+        if count:
+            self.scrollbar.set(self._top / count, (self._top + last - first) / count)
+        else:
+            self.scrollbar.set(0, 1)
+        self._update_status()
+
+    def _update_status(self):
+        count = self._stop - self._start
+        text = f"{count:,} of {len(self.index):,}" if self._prefix else f"{count:,}"
+        self.status.configure(text=f"Scanning... {text}" if self._scanning else text)
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        count = self._stop - self._start
+        if action == "moveto":
+            self._top = int(float(amount) * count)
+            self._render()
+        else:
+            self._scroll(int(amount) * (self.rows if unit == "pages" else 1))
+
+    def _scroll(self, rows):
+        self._top += rows
+        self._render()
+        return "break"
+
+    def _on_select(self, event=None):
+        selected = self.listbox.curselection()
+        if selected:
+            self._selected = self.index[self._start + self._top + selected[0]]
+
+    def _move_selection(self, delta):
+        """Move the selection with the arrow keys, scrolling the window to follow it"""
+        count = self._stop - self._start
+        if not count:
+            return "break"
+        selected = self.listbox.curselection()
+        position = self._top + selected[0] + delta if selected else 0
+        position = max(0, min(position, count - 1))
+        if position < self._top:
+            self._top = position
+        elif position >= self._top + self.rows:
+            self._top = position - self.rows + 1
+        self._selected = self.index[self._start + position]
+        self._render()
+        return "break"
+
+    def _activate(self):
+        if self._selected is not None and self.on_activate:
+            self.on_activate()
+        return "break"
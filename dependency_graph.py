@@ -0,0 +1,62 @@
+_MISSING = object()
+
+
+class DependencyGraph:
+    """Static formulas for derived values and the values they depend on.
+
+    The graph is only structure, so one instance can be shared by every
+    character; per-character values live in a DependencyCache.
+    """
+
+    def __init__(self):
+        self.formulas = {}
+        self.dependents = {}
+
+    def add_derived(self, name, deps, func):
+        """Define name as func(*values of deps)"""
+        self.formulas[name] = (func, tuple(deps))
+        for dep in deps:
+            self.dependents.setdefault(dep, []).append(name)
+
+
+class DependencyCache:
+    """Input values plus lazily computed, cached derived values for one graph.
+
+    Setting an input drops only the cached values that depend on it, directly
+    or transitively; everything else keeps being served from the cache.
+    """
+
+    __slots__ = ("graph", "values", "cache")
+
+    def __init__(self, graph, inputs=None):
+        self.graph = graph
+        self.values = dict(inputs or {})
+        self.cache = {}
+
+    def get(self, name):
+        """Current value of an input or derived value"""
+        value = self.values.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = self.cache.get(name, _MISSING)
+        if value is _MISSING:
+            func, deps = self.graph.formulas[name]
+            value = self.cache[name] = func(*[self.get(dep) for dep in deps])
+        return value
+
+    def set(self, name, value):
+        """Set an input, invalidating dependents only if the value changed"""
+        if self.values.get(name, _MISSING) == value:
+            return
+        self.values[name] = value
+        self.invalidate(name)
+
+    def invalidate(self, name):
+        """Drop every cached value downstream of name"""
+        dependents = self.graph.dependents
+        stack = list(dependents.get(name, ()))
+        while stack:
+            derived = stack.pop()
+            # A value that isn't cached can't have cached dependents either
+            if self.cache.pop(derived, _MISSING) is not _MISSING:
+                stack.extend(dependents.get(derived, ()))
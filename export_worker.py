@@ -0,0 +1,143 @@
+import copy
+import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+# How often the Tk main loop drains finished work, in milliseconds
+POLL_INTERVAL_MS = 50
+
+
+class ExportJob:
+    """One queued sheet export and its current state.
+
+    state moves from "queued" through "rendering" to "done", "failed" or
+    "cancelled"; error holds the failure message.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.name = data.get("Name", "Character")
+        self.file_name = self.name + ".pdf"
+        self.state = "queued"
+        self.error = None
+        self.cancelled = False
+        self.future = None
+
+    @property
+    def finished(self):
+        return self.state in ("done", "failed", "cancelled")
+
+
+class ExportWorker:
+    """Runs sheet exports on a background thread, one at a time, in order.
+
+    The worker thread never touches Tk: it posts state changes to a queue,
+    which the main loop drains every POLL_INTERVAL_MS through root.after
+    and reports to on_update(job). Each job renders the sheet in memory
+    and only then writes the PDF, so a job that is cancelled or fails part
+    way leaves nothing on disk. The character itself is saved on the main
+    thread once its PDF is written, as stores such as SQLiteCharacterStore
+    may only be used from the thread that created them.
+    """
+
+    def __init__(self, root, pdf_generator, file_manager, spell_database, on_update=None):
+        self.root = root
+        self.pdf_generator = pdf_generator
+        self.file_manager = file_manager
+        self.spell_database = spell_database
+        self.on_update = on_update
+        self.jobs = []
+        self._events = queue.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sheet-export")
+        self._poll_job = None
+
+    def submit(self, data):
+        """Queue an export of a snapshot of data, returning its ExportJob"""
+        job = ExportJob(copy.deepcopy(data))
+        self.jobs.append(job)
+        job.future = self._executor.submit(self._run, job)
+        self._schedule_poll()
+        return job
+
+    def cancel(self):
+        """Cancel every export that hasn't finished yet.
+
+        Queued jobs never start. A sheet already rendering finishes in the
+        background, but its files are not written.
+        """
+        for job in self.pending():
+            job.cancelled = True
+            if job.future.cancel():
+                self._events.put((job, "cancelled", None))
+        self._schedule_poll()
+
+    def pending(self):
+        """Jobs still queued or rendering"""
+        return [job for job in self.jobs if not job.finished]
+
+    def progress(self):
+        """(finished, total) over the jobs since the queue last ran empty"""
+        return sum(job.finished for job in self.jobs), len(self.jobs)
+
+    def shutdown(self, finish=False):
+        """Stop the worker thread, for when the app closes.
+
+        With finish, every queued export is completed first; otherwise they
+        are cancelled. Either way this waits for the worker thread and then
+        saves the characters whose PDFs were written, so nothing is left
+        half done once the main loop is gone.
+        """
+        if not finish:
+            self.cancel()
+        self._executor.shutdown(wait=True)
+        if self._poll_job is not None:
+            self.root.after_cancel(self._poll_job)
+            self._poll_job = None
+        self._drain_events()
+
+    def _run(self, job):
+        """Worker thread: render and write one sheet's PDF"""
+        if job.cancelled:
+            self._events.put((job, "cancelled", None))
+            return
+        self._events.put((job, "rendering", None))
+        try:
+            pdf = self.pdf_generator.render_pdf(job.data, spell_database=self.spell_database)
+            if job.cancelled:
+                self._events.put((job, "cancelled", None))
+                return
+            tmp_file = f"{job.file_name}.{os.getpid()}.tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(pdf)
+            os.replace(tmp_file, job.file_name)
+            self._events.put((job, "done", None))
+        except Exception as e:
+            self._events.put((job, "failed", f"{type(e).__name__}: {e}"))
+
+    def _schedule_poll(self):
+        if self._poll_job is None:
+            self._poll_job = self.root.after(POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self):
+        """Main thread: apply queued state changes and report them"""
+        self._poll_job = None
+        self._drain_events()
+        if self.pending():
+            self._schedule_poll()
+        else:
+            self.jobs = []
+
+    def _drain_events(self):
+        """Main thread: apply every queued state change, saving exported characters"""
+        while True:
+            try:
+                job, state, error = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if job.finished:
+                continue  # Already cancelled before it could start
+            job.state, job.error = state, error
+            if state == "done":
+                self.file_manager.save_character_data(job.data)
+            if self.on_update:
+                self.on_update(job)
@@ -1,26 +1,211 @@
 import json
 import os
+import threading
 from pathlib import Path
 
+ROSTER_INDEX_VERSION = 1
+JOURNAL_NAME = ".autosave_journal"
+
+
 class FileManager:
     def __init__(self):
         self.characters_dir = Path("characters")
         self.characters_dir.mkdir(exist_ok=True)
-    
+        # Manifest of every character file, so listing the roster only
+        # re-parses files whose mtime or size changed since the last scan
+        self.index_file = self.characters_dir / ".roster_index"
+        self._roster = None
+        # Guards the roster index, which a background scan updates
+        self._roster_lock = threading.RLock()
+
+        # Autosave journal: the latest journaled data per character file, the
+        # files whose journaled edits aren't written yet, the file being
+        # autosaved now, the (name, file) of the character loaded in this
+        # session, files superseded by a rename in this session and files
+        # that autosave created (the only ones it may overwrite, besides the
+        # one loaded, and the only ones a rename may delete)
+        self.journal_file = self.characters_dir / JOURNAL_NAME
+        self._journal_state = {}
+        self._journal_dirty = set()
+        self._autosave_file = None
+        self._autosave_loaded = None
+        self._journal_replaced = set()
+        self._autosave_created = set()
+        self.recover_journal()
+
+    def _character_file(self, data):
+        """Path of the JSON file a character is saved to"""
+        char_name = data.get("Name", "Character").replace(" ", "_").replace("/", "_")
+        return self.characters_dir / f"{char_name}.json"
+
+    def _write_character_file(self, json_file, data):
+        """Atomically replace a character file, so a crash never leaves it truncated"""
+        tmp_file = json_file.with_name(json_file.name + ".tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_file, json_file)
+        self._update_roster_entry(json_file, data)
+
     def save_character_data(self, data):
         """Save character data to JSON file"""
-        char_name = data.get("Name", "Character").replace(" ", "_").replace("/", "_")
-        json_file = self.characters_dir / f"{char_name}.json"
-        
+        json_file = self._character_file(data)
+
         try:
-            with open(json_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self._write_character_file(json_file, data)
+            # The saved data supersedes any journaled edits of the same file,
+            # and a saved file is the user's: no later rename may delete it
+            self._journal_state[json_file.name] = json.loads(json.dumps(data))
+            self._journal_dirty.discard(json_file.name)
+            self._autosave_created.discard(json_file.name)
+            self._journal_replaced.discard(json_file.name)
             print(f"Character data saved to {json_file}")
             return True
         except Exception as e:
             print(f"Error saving character data: {e}")
             return False
-    
+
+    def start_autosave_session(self, data=None, character_ref=None):
+        """Begin autosaving a different character, optionally the one just loaded.
+
+        data is the loaded character as the editor holds it and
+        character_ref the path it was loaded from: its edits are autosaved
+        to that file for as long as the name is unchanged. Pending edits are
+        written first. Renames in a new session never delete the files of
+        earlier ones.
+        """
+        self.compact_journal()
+        self._autosave_file = self._autosave_loaded = None
+        self._autosave_created.clear()
+        if data is not None and character_ref is not None:
+            key = Path(character_ref).name
+            self._journal_state[key] = json.loads(json.dumps(data))
+            self._autosave_file = key
+            self._autosave_loaded = (data.get("Name", "Character"), key)
+
+    def autosave_character_data(self, data):
+        """Record an edit in the append-only autosave journal.
+
+        Only the fields that changed since the last record of the same file
+        are appended, so an edit costs a short append rather than a rewrite
+        of the character file; compact_journal folds the journal into the
+        files later. Returns True if anything was recorded.
+        """
+        # Compare as stored: JSON turns keys such as the spell slot levels into strings
+        data = json.loads(json.dumps(data))
+        key = self._autosave_target(data)
+        previous = self._journal_state.get(key)
+        if previous is None:
+            record = {"file": key, "data": data}
+        else:
+            changes = {field: value for field, value in data.items() if previous.get(field) != value}
+            if not changes:
+                return False
+            record = {"file": key, "set": changes}
+        if self._autosave_file not in (None, key):
+            # Renaming the character moves the autosave to a new file
+            record["replaces"] = self._autosave_file
+
+        line = json.dumps(record, separators=(",", ":"))
+        try:
+            with open(self.journal_file, 'a') as f:
+                f.write(line + "\n")
+        except OSError as e:
+            print(f"Error writing autosave journal: {e}")
+            return False
+        self._apply_journal_record(json.loads(line))
+        self._autosave_file = key
+        return True
+
+    def _autosave_target(self, data):
+        """Name of the file to autosave data to, never one this session didn't load or create.
+
+        A name that belongs to another saved character is autosaved beside
+        it as "<name>-autosave.json", "<name>-autosave-2.json", ... instead.
+        """
+        if self._autosave_loaded and data.get("Name", "Character") == self._autosave_loaded[0]:
+            return self._autosave_loaded[1]
+        json_file = self._character_file(data)
+        stem = json_file.stem
+        attempt = 0
+        while True:
+            key = json_file.name
+            if key == self._autosave_file or key in self._autosave_created:
+                return key
+            if not json_file.exists():
+                self._autosave_created.add(key)
+                return key
+            attempt += 1
+            json_file = json_file.with_name(f"{stem}-autosave.json" if attempt == 1
+                                            else f"{stem}-autosave-{attempt}.json")
+
+    def _apply_journal_record(self, record):
+        """Fold one journal record into the in-memory journal state"""
+        key = record["file"]
+        if "data" in record:
+            self._journal_state[key] = record["data"]
+        else:
+            base = self._journal_state.get(key)
+            if base is None:
+                base = self.load_character_data(self.characters_dir / key)
+                if not isinstance(base, dict):
+                    return
+            base.update(record["set"])
+            self._journal_state[key] = base
+        self._journal_dirty.add(key)
+
+        replaced = record.get("replaces")
+        if replaced:
+            self._journal_state.pop(replaced, None)
+            self._journal_dirty.discard(replaced)
+            self._journal_replaced.add(replaced)
+
+    def compact_journal(self):
+        """Write every character with journaled edits to its file and empty the journal.
+
+        Returns False, keeping the journal, if any file couldn't be written.
+        """
+        try:
+            for key in sorted(self._journal_dirty):
+                json_file = self.characters_dir / key
+                if not json_file.exists():
+                    self._autosave_created.add(key)
+                self._write_character_file(json_file, self._journal_state[key])
+                self._journal_dirty.discard(key)
+
+            # Files an earlier name of this character was autosaved to
+            for key in self._journal_replaced & self._autosave_created:
+                if key != self._autosave_file:
+                    self.delete_character_file(self.characters_dir / key)
+            self._journal_replaced.clear()
+
+            if self.journal_file.exists():
+                self.journal_file.unlink()
+            return True
+        except OSError as e:
+            print(f"Error compacting autosave journal: {e}")
+            return False
+
+    def recover_journal(self):
+        """Fold a journal left behind by a crash into the character files"""
+        try:
+            with open(self.journal_file, 'r') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            print(f"Error reading autosave journal: {e}")
+            return
+
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break  # A record torn by the crash; everything before it is intact
+            self._apply_journal_record(record)
+        # A crashed session's files are kept whatever their name
+        self._journal_replaced.clear()
+        self.compact_journal()
+
     def load_character_data(self, json_file):
         """Load character data from JSON file"""
         try:
@@ -30,32 +215,133 @@ class FileManager:
         except Exception as e:
             print(f"Error loading character data: {e}")
             return None
-    
+
     def get_available_characters(self):
         """Get list of available character files"""
         if not self.characters_dir.exists():
             return []
-        
-        characters = []
-        for json_file in self.characters_dir.glob("*.json"):
-            try:
-                data = self.load_character_data(json_file)
-                if data and "Name" in data:
-                    characters.append((data["Name"], str(json_file)))
-            except:
-                continue
-        
-        return characters
-    
+
+        return [(entry["name"], entry["path"]) for entry in self.scan_roster()]
+
+    def iter_available_characters(self, batch_size=500):
+        """Yield lists of (name, path) pairs as the roster scan finds them"""
+        if not self.characters_dir.exists():
+            return
+        for batch in self.iter_roster(batch_size):
+            yield [(entry["name"], entry["path"]) for entry in batch]
+
+    def scan_roster(self):
+        """Refresh the roster index and return its entries for valid characters"""
+        return [entry for batch in self.iter_roster() for entry in batch]
+
+    def iter_roster(self, batch_size=500):
+        """Refresh the roster index, yielding its valid entries in batches as they are found.
+
+        Files unchanged since the last scan come straight from the index, so
+        only new or modified files are parsed. Safe to run on a background
+        thread while characters are saved on the main thread.
+        """
+        with self._roster_lock:
+            roster = self._load_roster_index()
+            known = dict(roster)
+        seen = set()
+        changed = False
+        batch = []
+
+        with os.scandir(self.characters_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                seen.add(entry.name)
+
+                stat = entry.stat()
+                roster_entry = known.get(entry.name)
+                if not (roster_entry and roster_entry["mtime"] == stat.st_mtime_ns
+                        and roster_entry["size"] == stat.st_size):
+                    json_file = self.characters_dir / entry.name
+                    roster_entry = self._make_roster_entry(json_file, stat, self.load_character_data(json_file))
+                    with self._roster_lock:
+                        roster[entry.name] = roster_entry
+                    changed = True
+
+                if roster_entry["name"] is not None:
+                    batch.append(roster_entry)
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+
+        with self._roster_lock:
+            # Only drop entries that were indexed before the scan; newer ones were saved meanwhile
+            for file_name in set(known) - seen:
+                if roster.get(file_name) is known[file_name]:
+                    del roster[file_name]
+                    changed = True
+            if changed:
+                self._save_roster_index()
+
+        if batch:
+            yield batch
+
     def delete_character(self, character_name):
         """Delete a character's JSON file"""
-        char_filename = character_name.replace(" ", "_").replace("/", "_")
-        json_file = self.characters_dir / f"{char_filename}.json"
-        
+        json_file = self._character_file({"Name": character_name})
+
         try:
             if json_file.exists():
-                json_file.unlink()
+                self.delete_character_file(json_file)
                 return True
         except Exception as e:
             print(f"Error deleting character: {e}")
-        return False
\ No newline at end of file
+        return False
+
+    def delete_character_file(self, json_file):
+        """Remove a character file and its roster index entry"""
+        json_file.unlink(missing_ok=True)
+        self._journal_state.pop(json_file.name, None)
+        self._journal_dirty.discard(json_file.name)
+        with self._roster_lock:
+            if self._load_roster_index().pop(json_file.name, None) is not None:
+                self._save_roster_index()
+
+    def _make_roster_entry(self, json_file, stat, data):
+        """Build the manifest entry for a character file"""
+        # Unreadable or nameless files are still recorded so they aren't re-parsed on every scan
+        valid = isinstance(data, dict) and "Name" in data
+        return {
+            "name": data["Name"] if valid else None,
+            "path": str(json_file),
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "class": data.get("Class", "") if valid else "",
+            "level": data.get("Level", 1) if valid else 1,
+        }
+
+    def _update_roster_entry(self, json_file, data):
+        """Record a freshly written character file in the roster index"""
+        entry = self._make_roster_entry(json_file, json_file.stat(), data)
+        with self._roster_lock:
+            self._load_roster_index()[json_file.name] = entry
+            self._save_roster_index()
+
+    def _load_roster_index(self):
+        """Load the roster index from disk, starting empty if it is missing or stale"""
+        if self._roster is None:
+            self._roster = {}
+            try:
+                with open(self.index_file, 'r') as f:
+                    index = json.load(f)
+                if index.get("version") == ROSTER_INDEX_VERSION:
+                    self._roster = index["entries"]
+            except (OSError, ValueError, KeyError, AttributeError):
+                pass
+        return self._roster
+
+    def _save_roster_index(self):
+        """Write the roster index next to the character files"""
+        tmp_file = self.index_file.with_name(self.index_file.name + ".tmp")
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump({"version": ROSTER_INDEX_VERSION, "entries": self._roster}, f)
+            os.replace(tmp_file, self.index_file)
+        except OSError as e:
+            print(f"Error saving roster index: {e}")
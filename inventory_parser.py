@@ -0,0 +1,107 @@
+import re
+from collections import namedtuple
+
+InventoryItem = namedtuple("InventoryItem", ["key", "quantity"])
+
+TOKEN_PATTERN = re.compile(r"\d+|[a-z]+")
+
+_END = object()  # trie marker holding the item key for a complete phrase
+
+
+class InventoryMatcher:
+    """Single-pass longest-match item finder over inventory text.
+
+    The catalog maps item phrases (e.g. "chain mail") to item keys and is
+    compiled once into a word trie. Parsing tokenizes the text once and takes
+    the longest catalog phrase at each position, so whole words are matched
+    ("longsword" never also counts as "sword") in time linear in the text.
+    A word that matches no phrase falls back to the longest one-word phrase
+    it ends with, so compounds such as "shortbow" or "warhammer" still count
+    as "bow" and "hammer".
+    """
+
+    def __init__(self, catalog):
+        self.trie = {}
+        for phrase, key in catalog.items():
+            words = phrase.lower().split()
+            self._insert(words, key)
+            # Accept simple plurals, e.g. "2 daggers"
+            if not words[-1].endswith("s"):
+                self._insert(words[:-1] + [words[-1] + "s"], key)
+        # One-word phrases, longest first, for the compound word fallback
+        self.suffixes = sorted(((word, node[_END]) for word, node in self.trie.items() if _END in node),
+                               key=lambda suffix: len(suffix[0]), reverse=True)
+
+    def _insert(self, words, key):
+        node = self.trie
+        for word in words:
+            node = node.setdefault(word, {})
+        node[_END] = key
+
+    def parse(self, text):
+        """Return the catalog items found in text, in order of first appearance.
+
+        Quantities are read from a leading number ("2 daggers", "2x dagger")
+        or a trailing multiplier ("dagger x2") and summed across mentions.
+        """
+        tokens = TOKEN_PATTERN.findall(text.lower())
+        quantities = {}
+        pending = None
+        last_key = None
+        last_amount = 0
+        i = 0
+        count = len(tokens)
+
+        while i < count:
+            token = tokens[i]
+
+            if token.isdigit():
+                pending = int(token)
+                i += 1
+                if i < count and tokens[i] == "x":
+                    i += 1
+                last_key = None
+                continue
+
+            # Trailing multiplier on the item just matched
+            if token == "x" and last_key is not None and i + 1 < count and tokens[i + 1].isdigit():
+                quantities[last_key] += last_amount * (int(tokens[i + 1]) - 1)
+                last_key = None
+                i += 2
+                continue
+
+            key, end = self._longest_match(tokens, i)
+            if key is None:
+                key, end = self._suffix_match(token), i + 1
+            if key is None:
+                pending = None
+                last_key = None
+                i += 1
+                continue
+
+            last_amount = pending or 1
+            quantities[key] = quantities.get(key, 0) + last_amount
+            pending = None
+            last_key = key
+            i = end
+
+        return [InventoryItem(key, quantity) for key, quantity in quantities.items()]
+
+    def _suffix_match(self, token):
+        """Key of the longest one-word phrase that token is a compound of, or None"""
+        for word, key in self.suffixes:
+            if len(token) > len(word) and token.endswith(word):
+                return key
+        return None
+
+    def _longest_match(self, tokens, start):
+        """Longest catalog phrase beginning at tokens[start], as (key, end index)"""
+        node = self.trie
+        key, end = None, start
+        for i in range(start, len(tokens)):
+            node = node.get(tokens[i])
+            if node is None:
+                break
+            if _END in node:
+                key, end = node[_END], i + 1
+        return key, end
@@ -1,3 +1,4 @@
+import os
 import tkinter as tk
 from tkinter import ttk, messagebox
 
@@ -10,7 +11,6 @@ def main():
     try:
         from character_data import CharacterData
         from ui_components import CharacterCreatorUI
-        from pdf_generator import PDFGenerator
         from file_manager import FileManager
     except ImportError as e:
         messagebox.showerror("Import Error", f"Failed to import modules: {e}")
@@ -18,11 +18,16 @@ def main():
 
     # Initialize components
     character_data = CharacterData()
-    file_manager = FileManager()
-    pdf_generator = PDFGenerator()
+    # Use the SQLite backend when a roster database is configured
+    db_path = os.environ.get("DC20_CHARACTER_DB")
+    if db_path:
+        from sqlite_store import SQLiteCharacterStore
+        file_manager = SQLiteCharacterStore(db_path)
+    else:
+        file_manager = FileManager()
 
-    # Create and run the UI
-    app = CharacterCreatorUI(root, character_data, file_manager, pdf_generator)
+    # Create and run the UI; the PDF generator and reportlab load on first export
+    app = CharacterCreatorUI(root, character_data, file_manager)
 
     # Add scrollbar to main window if needed
     root.mainloop()
@@ -0,0 +1,50 @@
+import bisect
+
+# Sorts after every character, closing the key range of a prefix
+_PREFIX_END = "\U0010ffff"
+
+
+class NameIndex:
+    """Case-insensitively sorted (name, ref) pairs with prefix search.
+
+    Entries can be added in batches while a scan is still running. A prefix
+    search returns a (start, stop) range of positions, so a list view only
+    has to fetch the rows it shows, whatever the number of matches.
+    """
+
+    def __init__(self):
+        self.entries = []
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __getitem__(self, position):
+        """(name, ref) at a sorted position"""
+        _, name, ref = self.entries[position]
+        return name, ref
+
+    def add_batch(self, items):
+        """Add (name, ref) pairs, keeping the index sorted"""
+        batch = sorted((name.casefold(), name, ref) for name, ref in items)
+        if not batch:
+            return
+        if not self.entries or batch[0] >= self.entries[-1]:
+            self.entries.extend(batch)
+        else:
+            # Two sorted runs, which sort() merges in linear time
+            self.entries.extend(batch)
+            self.entries.sort()
+
+    def prefix_range(self, prefix, start=0, stop=None):
+        """(start, stop) positions of the names beginning with prefix.
+
+        Passing the range of a shorter prefix narrows that range instead of
+        searching the whole index, as when the user types one more letter.
+        """
+        if stop is None:
+            stop = len(self.entries)
+        key = prefix.casefold()
+        if not key:
+            return start, stop
+        return (bisect.bisect_left(self.entries, (key,), start, stop),
+                bisect.bisect_left(self.entries, (key + _PREFIX_END,), start, stop))
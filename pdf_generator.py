@@ -1,11 +1,130 @@
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
+import hashlib
+import io
+import json
+from collections import namedtuple
+from functools import lru_cache
+
 from reportlab.lib import colors
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+from character_model import ATTRIBUTE_NAMES, SKILL_NAMES
+from render_backends import SVGBackend, TkCanvasBackend
+from render_cache import RenderCache, sheet_key
+from sheet_canvas import SheetCanvas, content_stream_stats
+from sheet_layout import DEFAULT_LAYOUT, CompiledLayout, load_layout_spec
+
+# Bump whenever drawing code changes what a sheet looks like, so cached
+# renders from the old layout are no longer used
+LAYOUT_VERSION = 7
+
+# A spell card measured by the layout pass: description lines, total height,
+# for the parts of a card split across pages the index of its first line, and
+# the name of the form it is recorded as when a document reuses it
+SpellCard = namedtuple("SpellCard", ["name", "spell", "lines", "height", "first_line", "form_name"])
+
+
+@lru_cache(maxsize=4096)
+def wrap_text(text, max_line_width, font, size):
+    """Greedy word wrap of text to max_line_width, memoized per (text, width, font)"""
+    lines = []
+    current_line = []
+    line_width = 0
+
+    for word in text.split():
+        word_width = stringWidth(word + " ", font, size)
+        if line_width + word_width <= max_line_width:
+            current_line.append(word)
+            line_width += word_width
+        else:
+            if current_line:
+                lines.append(" ".join(current_line))
+            current_line = [word]
+            line_width = word_width
+
+    if current_line:
+        lines.append(" ".join(current_line))
+    return tuple(lines)
 
 
 class PDFGenerator:
-    def __init__(self):
-        pass
+    """Renders DC20 character sheets.
+
+    Page geometry comes from a declarative layout in layouts/ (see
+    sheet_layout). Static artwork (borders, captions, table grids, empty
+    boxes) is recorded once per document as reportlab form XObjects and
+    reused on every sheet; only the per-character values are drawn on top.
+    """
+
+    def __init__(self, cache_dir=None, cache_max_bytes=256 * 1024 * 1024, layout=DEFAULT_LAYOUT, compress=True):
+        # Rendered sheets are reused from cache_dir when their inputs are unchanged
+        self.render_cache = RenderCache(cache_dir, cache_max_bytes) if cache_dir else None
+        self.layout = CompiledLayout(load_layout_spec(layout), self.layout_components())
+        # Flate-compress page and form streams
+        self.compress = compress
+
+    def new_canvas(self, target, compress=None):
+        """Canvas for the layout's page size writing to a file name or binary stream"""
+        if compress is None:
+            compress = self.compress
+        return SheetCanvas(target, pagesize=self.layout.page_size, pageCompression=1 if compress else 0)
+
+    def layout_components(self):
+        """Drawing components that layout ops refer to by name"""
+        return {
+            "text": self.draw_text,
+            "rule": self.draw_rule,
+            "header_frame": self.draw_dc20_header_frame,
+            "resources_frame": self.draw_resources_frame,
+            "prime_frame": self.draw_prime_hexagon,
+            "attribute_frame": self.draw_attribute_hexagon,
+            "skill_columns": self.draw_skill_columns,
+            "skill_trainings": self.draw_skill_trainings,
+            "combat_frame": self.draw_combat_frame,
+            "attacks_frame": self.draw_attacks_frame,
+            "attacks_table": self.draw_attacks_table,
+            "inventory_frame": self.draw_inventory_frame,
+            "inventory": self.draw_inventory,
+        }
+
+    def draw_template(self, c, name, draw_func):
+        """Draw static artwork through a named form XObject, recording it on first use"""
+        if not c.hasForm(name):
+            c.beginForm(name)
+            draw_func(c)
+            c.endForm()
+        c.doForm(name)
+
+    def draw_strings(self, c, items, font, size):
+        """Draw (x, y, text) items in one font as a single text object"""
+        c.setFont(font, size)
+        text = c.beginText()
+        for x, y, line in items:
+            text.setTextOrigin(x, y)
+            text.textOut(line)
+        c.drawText(text)
+
+    def draw_centered_string(self, c, cx, y, text, font, size):
+        """Draw text horizontally centered on cx"""
+        c.setFont(font, size)
+        c.drawString(cx - c.stringWidth(text, font, size) / 2, y, text)
+
+    def draw_text(self, c, text, x, y, font="Helvetica", size=10, align="left"):
+        """Draw a line of black text aligned left, center or right on x"""
+        c.setFillColor(colors.black)
+        if align == "center":
+            self.draw_centered_string(c, x, y, text, font, size)
+        else:
+            c.setFont(font, size)
+            if align == "right":
+                c.drawRightString(x, y, text)
+            else:
+                c.drawString(x, y, text)
+
+    def draw_rule(self, c, x, y, length, line_width=1):
+        """Draw a horizontal black line"""
+        c.setStrokeColor(colors.black)
+        c.setLineWidth(line_width)
+        c.line(x, y, x + length, y)
 
     def draw_hexagonal_border(self, c, x, y, width, height):
         """Draw hexagonal/angular border like DC20 style"""
@@ -13,24 +132,21 @@ class PDFGenerator:
         c.setStrokeColor(colors.black)
         c.setLineWidth(2)
 
-        # Draw angular border with cut corners
-        path = [
-            (x + corner_cut, y),
-            (x + width - corner_cut, y),
-            (x + width, y + corner_cut),
-            (x + width, y + height - corner_cut),
-            (x + width - corner_cut, y + height),
-            (x + corner_cut, y + height),
-            (x, y + height - corner_cut),
-            (x, y + corner_cut),
-            (x + corner_cut, y)
-        ]
-
-        for i in range(len(path) - 1):
-            c.line(path[i][0], path[i][1], path[i + 1][0], path[i + 1][1])
-
-    def draw_attribute_hexagon(self, c, x, y, attr_name, attr_value, width=100, height=120):
-        """Draw DC20-style attribute section with hexagonal styling"""
+        # Angular border with cut corners, as one closed path
+        path = c.beginPath()
+        path.moveTo(x + corner_cut, y)
+        path.lineTo(x + width - corner_cut, y)
+        path.lineTo(x + width, y + corner_cut)
+        path.lineTo(x + width, y + height - corner_cut)
+        path.lineTo(x + width - corner_cut, y + height)
+        path.lineTo(x + corner_cut, y + height)
+        path.lineTo(x, y + height - corner_cut)
+        path.lineTo(x, y + corner_cut)
+        path.close()
+        c.drawPath(path, stroke=1, fill=0)
+
+    def draw_attribute_hexagon(self, c, x, y, attr_name, width=100, height=120):
+        """Draw the static DC20-style attribute frame with hexagonal styling"""
         # Main hexagonal border
         self.draw_hexagonal_border(c, x, y, width, height)
 
@@ -44,21 +160,10 @@ class PDFGenerator:
 
         # Top section with abbreviation
         c.setFillColor(colors.black)
-        c.setFont("Helvetica-Bold", 12)
-        text_width = c.stringWidth(abbrev, "Helvetica-Bold", 12)
-        c.drawString(x + width / 2 - text_width / 2, y + height - 20, abbrev)
-
-        # Large attribute value in center
-        c.setFont("Helvetica-Bold", 36)
-        value_text = str(attr_value)
-        value_width = c.stringWidth(value_text, "Helvetica-Bold", 36)
-        c.drawString(x + width / 2 - value_width / 2, y + height / 2 - 8, value_text)
+        self.draw_centered_string(c, x + width / 2, y + height - 20, abbrev, "Helvetica-Bold", 12)
 
         # SAVE label and box at bottom
-        c.setFont("Helvetica-Bold", 10)
-        save_text = "SAVE"
-        save_width = c.stringWidth(save_text, "Helvetica-Bold", 10)
-        c.drawString(x + width / 2 - save_width / 2, y + 25, save_text)
+        self.draw_centered_string(c, x + width / 2, y + 25, "SAVE", "Helvetica-Bold", 10)
 
         # Save modifier box
         save_box_width = 25
@@ -70,8 +175,8 @@ class PDFGenerator:
         c.setFillColor(colors.white)
         c.rect(save_x, save_y, save_box_width, save_box_height, fill=1, stroke=1)
 
-    def draw_expertise_boxes(self, c, x, y, training_level, box_count=5):
-        """Draw expertise level boxes"""
+    def draw_expertise_boxes(self, c, x, y, training_level, box_count=5, filled_only=False):
+        """Draw expertise level boxes, or just the filled ones over an empty template"""
         box_size = 8
         box_spacing = 2
 
@@ -86,62 +191,47 @@ class PDFGenerator:
         elif training_level == "Grandmaster":
             filled_boxes = 5
 
-        for i in range(box_count):
-            box_x = x + (i * (box_size + box_spacing))
-
-            c.setStrokeColor(colors.black)
-            c.setLineWidth(1)
-
-            if i < filled_boxes:
-                c.setFillColor(colors.black)
-            else:
-                c.setFillColor(colors.white)
-
-            c.rect(box_x, y, box_size, box_size, fill=1, stroke=1)
-
-    def draw_skill_column(self, c, x, y, attr_name, skills_data, column_width=110):
-        """Draw a column of skills for an attribute"""
-        current_y = y
-
-        # Attribute header
-        c.setFont("Helvetica-Bold", 10)
+        c.setStrokeColor(colors.black)
+        c.setLineWidth(1)
+        # One path per fill color: the filled boxes, then the empty ones
+        for fill_color, first, last in ((colors.black, 0, filled_boxes),
+                                        (colors.white, filled_boxes, 0 if filled_only else box_count)):
+            if first >= last:
+                continue
+            path = c.beginPath()
+            for i in range(first, last):
+                path.rect(x + (i * (box_size + box_spacing)), y, box_size, box_size)
+            c.setFillColor(fill_color)
+            c.drawPath(path, stroke=1, fill=1)
+
+    def skill_layout(self, x, y, attr_spacing=115):
+        """Map each skill to the (x, y) of its label in the skill columns"""
+        positions = {}
+        for i, attr_name in enumerate(ATTRIBUTE_NAMES):
+            row_y = y - 20
+            for skill_name, skill_attr in SKILL_NAMES:
+                if skill_attr == attr_name:
+                    positions[skill_name] = (x + i * attr_spacing, row_y)
+                    row_y -= 30
+        return positions
+
+    def draw_skill_columns(self, c, x, y, attr_spacing=115):
+        """Draw the static skill columns: headers, skill names and empty expertise boxes"""
+        positions = self.skill_layout(x, y, attr_spacing)
         c.setFillColor(colors.black)
-        header_text = attr_name.upper()
-        c.drawString(x, current_y, header_text)
-        current_y -= 20
-
-        # Skills
-        for skill_name, skill_value, training in skills_data:
-            # Skill name
-            c.setFont("Helvetica", 9)
-            c.setFillColor(colors.black)
-            c.drawString(x, current_y, skill_name.upper())
-
-            # Expertise boxes
-            self.draw_expertise_boxes(c, x, current_y - 15, training)
-
-            current_y -= 30
-
-        # Add some empty slots with labels if needed
-        skill_names_by_attr = {
-            "MIGHT": ["ATHLETICS", "INTIMIDATION"],
-            "AGILITY": ["ACROBATICS", "STEALTH", "TRICKERY"],
-            "CHARISMA": ["ANIMAL", "INFLUENCE", "INSIGHT"],
-            "INTELLIGENCE": ["INVESTIGATION", "MEDICINE", "SURVIVAL"]
-        }
+        self.draw_strings(c, [(x + i * attr_spacing, y, attr_name.upper())
+                              for i, attr_name in enumerate(ATTRIBUTE_NAMES)], "Helvetica-Bold", 10)
+        self.draw_strings(c, [(skill_x, skill_y, skill_name.upper())
+                              for skill_name, (skill_x, skill_y) in positions.items()], "Helvetica", 9)
 
-        # Show all possible skills for this attribute, even if not trained
-        all_skills = skill_names_by_attr.get(attr_name.upper(), [])
-        trained_skills = [skill[0] for skill in skills_data]
+        for skill_x, skill_y in positions.values():
+            self.draw_expertise_boxes(c, skill_x, skill_y - 15, "None")
 
-        for skill_name in all_skills:
-            if skill_name not in [s.upper() for s in trained_skills]:
-                c.setFont("Helvetica", 9)
-                c.setFillColor(colors.black)
-                c.drawString(x, current_y, skill_name)
-                # Draw empty expertise boxes
-                self.draw_expertise_boxes(c, x, current_y - 15, "None")
-                current_y -= 30
+    def draw_skill_trainings(self, c, skills, x, y, attr_spacing=115):
+        """Fill the expertise boxes of trained skills"""
+        for skill_name, (skill_x, skill_y) in self.skill_layout(x, y, attr_spacing).items():
+            if skill_name in skills:
+                self.draw_expertise_boxes(c, skill_x, skill_y - 15, skills[skill_name]["training"], filled_only=True)
 
     def draw_prime_hexagon(self, c, x, y):
         """Draw the large PRIME attribute hexagon"""
@@ -155,68 +245,34 @@ class PDFGenerator:
 
         # PRIME label
         c.setFillColor(colors.black)
-        c.setFont("Helvetica-Bold", 10)
-        prime_text = "PRIME"
-        prime_width = c.stringWidth(prime_text, "Helvetica-Bold", 10)
-        c.drawString(x + width / 2 - prime_width / 2, y + height - 15, prime_text)
+        self.draw_centered_string(c, x + width / 2, y + height - 15, "PRIME", "Helvetica-Bold", 10)
 
         # Subtitle
-        c.setFont("Helvetica", 7)
-        subtitle = "= Highest Attribute"
-        sub_width = c.stringWidth(subtitle, "Helvetica", 7)
-        c.drawString(x + width / 2 - sub_width / 2, y + 8, subtitle)
+        self.draw_centered_string(c, x + width / 2, y + 8, "= Highest Attribute", "Helvetica", 7)
 
-    def draw_dc20_header(self, c, width, height, data):
-        """Draw the DC20-style header with proper layout"""
-        header_y = height - 80
+    def draw_dc20_header_frame(self, c, x, y, width):
+        """Draw the static DC20-style header: borders and captions"""
+        header_y = y + 10
 
         # Main header border
-        header_width = width - 100
         header_height = 70
-        self.draw_hexagonal_border(c, 50, header_y - 10, header_width, header_height)
+        self.draw_hexagonal_border(c, x, y, width, header_height)
 
-        # Character info layout
+        # Character info captions
+        level_x = x + width - 90
         c.setFillColor(colors.black)
-
-        # Left side - Player and Character name
-        c.setFont("Helvetica", 8)
-        c.drawString(60, header_y + 40, "PLAYER NAME")
-        c.setFont("Helvetica-Bold", 10)
-        c.drawString(60, header_y + 28, data.get("Player Name", ""))
-
-        c.setFont("Helvetica", 8)
-        c.drawString(60, header_y + 15, "CHARACTER NAME")
-        c.setFont("Helvetica-Bold", 12)
-        c.drawString(60, header_y + 2, data.get("Name", ""))
-
-        # Center - Class and Ancestry
-        center_x = 280
-        c.setFont("Helvetica", 8)
-        c.drawString(center_x, header_y + 40, "CLASS & SUBCLASS")
-        c.setFont("Helvetica-Bold", 10)
-        class_text = data.get("Class", "")
-        if data.get("Subclass"):
-            class_text += f" / {data.get('Subclass')}"
-        c.drawString(center_x, header_y + 28, class_text)
-
-        c.setFont("Helvetica", 8)
-        c.drawString(center_x, header_y + 15, "ANCESTRY & BACKGROUND")
-        c.setFont("Helvetica-Bold", 10)
-        ancestry_bg = f"{data.get('Ancestry', '')} / {data.get('Background', '')}"
-        c.drawString(center_x, header_y + 2, ancestry_bg)
+        self.draw_strings(c, [
+            (x + 10, header_y + 40, "PLAYER NAME"),
+            (x + 10, header_y + 15, "CHARACTER NAME"),
+            (x + 230, header_y + 40, "CLASS & SUBCLASS"),
+            (x + 230, header_y + 15, "ANCESTRY & BACKGROUND"),
+            (level_x + 15, header_y + 45, "LEVEL"),
+        ], "Helvetica", 8)
 
         # Right side - Level
-        level_x = width - 140
         level_size = 50
         self.draw_hexagonal_border(c, level_x, header_y + 10, level_size, level_size)
 
-        c.setFont("Helvetica", 8)
-        c.drawString(level_x + 15, header_y + 45, "LEVEL")
-        c.setFont("Helvetica-Bold", 20)
-        level_text = str(data.get("Level", 1))
-        level_width = c.stringWidth(level_text, "Helvetica-Bold", 20)
-        c.drawString(level_x + level_size / 2 - level_width / 2, header_y + 25, level_text)
-
         # Combat Mastery in a box
         cm_x = level_x - 70
         cm_size = 60
@@ -224,63 +280,38 @@ class PDFGenerator:
         c.setFillColor(colors.white)
         c.rect(cm_x + 2, header_y + 12, cm_size - 4, 46, fill=1, stroke=0)
 
-        c.setFillColor(colors.black)
-        c.setFont("Helvetica", 8)
         # Split into two lines
-        combat_width = c.stringWidth("COMBAT", "Helvetica", 8)
-        mastery_width = c.stringWidth("MASTERY", "Helvetica", 8)
-        c.drawString(cm_x + cm_size / 2 - combat_width / 2, header_y + 48, "COMBAT")
-        c.drawString(cm_x + cm_size / 2 - mastery_width / 2, header_y + 40, "MASTERY")
-
-        c.setFont("Helvetica-Bold", 16)
-        cm_text = str(data.get("Combat Mastery", 0))
-        cm_width = c.stringWidth(cm_text, "Helvetica-Bold", 16)
-        c.drawString(cm_x + cm_size / 2 - cm_width / 2, header_y + 20, cm_text)
-
-    def draw_resources_section(self, c, x, y, data):
-        """Draw the health and resources section"""
-        # Health Points
-        hp_width = 120
-        hp_height = 60
-        self.draw_hexagonal_border(c, x, y, hp_width, hp_height)
+        c.setFillColor(colors.black)
+        self.draw_centered_string(c, cm_x + cm_size / 2, header_y + 48, "COMBAT", "Helvetica", 8)
+        self.draw_centered_string(c, cm_x + cm_size / 2, header_y + 40, "MASTERY", "Helvetica", 8)
 
+    RESOURCE_LABELS = ["STAMINA POINTS", "MANA POINTS", "GRIT POINTS"]
+
+    def draw_resources_frame(self, c, x, y):
+        """Draw the static health and resources boxes"""
+        # Health Points
+        self.draw_hexagonal_border(c, x, y, 120, 60)
         c.setFillColor(colors.black)
         c.setFont("Helvetica-Bold", 10)
-        c.drawString(x + 10, y + hp_height - 15, "HEALTH POINTS")
-
-        hp = 10 + (int(data.get('Level', 1)) * int(data.get('Might', 0)))
-        c.setFont("Helvetica-Bold", 24)
-        hp_text = str(hp)
-        hp_width_text = c.stringWidth(hp_text, "Helvetica-Bold", 24)
-        c.drawString(x + hp_width / 2 - hp_width_text / 2, y + 20, hp_text)
+        c.drawString(x + 10, y + 45, "HEALTH POINTS")
 
         # Resources section
         resources_x = x + 150
-        resources_width = 200
-        resources_height = 60
-        self.draw_hexagonal_border(c, resources_x, y, resources_width, resources_height)
-
+        self.draw_hexagonal_border(c, resources_x, y, 200, 60)
         c.setFont("Helvetica-Bold", 10)
-        c.drawString(resources_x + 10, y + resources_height - 15, "RESOURCES")
-
-        # Resource items
-        c.setFont("Helvetica", 8)
-        resource_y = y + resources_height - 30
-        resources = [
-            ("STAMINA POINTS", str(data.get("Grit Points", 0))),
-            ("MANA POINTS", "0"),
-            ("GRIT POINTS", str(data.get("Grit Points", 0)))
-        ]
-
-        for label, value in resources:
-            c.drawString(resources_x + 10, resource_y, label)
-            c.setFont("Helvetica-Bold", 10)
-            c.drawString(resources_x + 120, resource_y, value)
-            c.setFont("Helvetica", 8)
-            resource_y -= 12
-
-    def draw_combat_section(self, c, x, y, data, width=300):
-        """Draw the combat statistics section"""
+        c.drawString(resources_x + 10, y + 45, "RESOURCES")
+
+        self.draw_strings(c, [(resources_x + 10, y + 30 - i * 12, label)
+                              for i, label in enumerate(self.RESOURCE_LABELS)], "Helvetica", 8)
+
+    COMBAT_FORMULAS = [
+        "ATTACK / SPELL CHECK = CM + Prime",
+        "SAVE DC = 10 + CM + Prime",
+        "INITIATIVE = CM + AGI"
+    ]
+
+    def draw_combat_frame(self, c, x, y, width=300):
+        """Draw the static combat statistics box and formulas"""
         height = 80
         self.draw_hexagonal_border(c, x, y, width, height)
 
@@ -293,24 +324,11 @@ class PDFGenerator:
         c.setFont("Helvetica-Bold", 12)
         c.drawString(x + 10, y + height - 15, "COMBAT")
 
-        # Combat formulas and values
-        c.setFont("Helvetica", 9)
-        formulas = [
-            ("ATTACK / SPELL CHECK = CM + Prime", str(data.get("Spell Check", 0))),
-            ("SAVE DC = 10 + CM + Prime", str(data.get("Save DC", 0))),
-            ("INITIATIVE = CM + AGI", str(data.get("Initiative", 0)))
-        ]
-
-        formula_y = y + height - 35
-        for formula, value in formulas:
-            c.drawString(x + 10, formula_y, formula)
-            c.setFont("Helvetica-Bold", 12)
-            c.drawString(x + width - 40, formula_y, value)
-            c.setFont("Helvetica", 9)
-            formula_y -= 15
-
-    def draw_attacks_table(self, c, x, y, weapons, width=400):
-        """Draw the attacks table"""
+        self.draw_strings(c, [(x + 10, y + height - 35 - i * 15, formula)
+                              for i, formula in enumerate(self.COMBAT_FORMULAS)], "Helvetica", 9)
+
+    def draw_attacks_frame(self, c, x, y, width=400):
+        """Draw the static attacks table: border, headers and row grid"""
         height = 120
         self.draw_hexagonal_border(c, x, y, width, height)
 
@@ -325,311 +343,416 @@ class PDFGenerator:
 
         # Table headers
         header_y = y + height - 35
-        c.setFont("Helvetica-Bold", 9)
-        c.drawString(x + 10, header_y, "Name")
-        c.drawString(x + 150, header_y, "Dmg.")
-        c.drawString(x + 250, header_y, "Type")
+        self.draw_strings(c, [(x + 10, header_y, "Name"), (x + 150, header_y, "Dmg."),
+                              (x + 250, header_y, "Type")], "Helvetica-Bold", 9)
 
-        # Draw horizontal line under headers
+        # Horizontal line under headers and row separators, as one path
         c.setStrokeColor(colors.black)
         c.setLineWidth(1)
-        c.line(x + 5, header_y - 5, x + width - 5, header_y - 5)
+        row_height = 18
+        rules = [(x + 5, header_y - 5, x + width - 5, header_y - 5)]
+        for i in range(1, 4):  # 4 attack slots
+            row_y = header_y - 15 - (i * row_height)
+            rules.append((x + 5, row_y + row_height - 5, x + width - 5, row_y + row_height - 5))
+        c.lines(rules)
 
-        # Weapon entries
-        c.setFont("Helvetica", 8)
+    def draw_attacks_table(self, c, weapons, x, y, width=400):
+        """Draw the weapon rows of the attacks table"""
+        header_y = y + 120 - 35
         row_height = 18
-        for i in range(4):  # 4 attack slots
+        cells = []
+        for i, (weapon_name, damage, weapon_type) in enumerate(weapons[:4]):
             row_y = header_y - 15 - (i * row_height)
+            cells += [(x + 10, row_y, weapon_name), (x + 150, row_y, str(damage)), (x + 250, row_y, weapon_type)]
+        if cells:
+            c.setFillColor(colors.black)
+            self.draw_strings(c, cells, "Helvetica", 8)
 
-            # Draw row separator lines
-            if i > 0:
-                c.line(x + 5, row_y + row_height - 5, x + width - 5, row_y + row_height - 5)
+    def draw_inventory_frame(self, c, x, y, width=450, height=70):
+        """Draw the static inventory box"""
+        self.draw_hexagonal_border(c, x, y, width, height)
+        c.setFillColor(colors.white)
+        c.rect(x + 2, y + 2, width - 4, height - 4, fill=1, stroke=0)
 
-            # Fill with weapon data
-            if i < len(weapons):
-                weapon_name, damage, weapon_type = weapons[i]
-                c.drawString(x + 10, row_y, weapon_name)
-                c.drawString(x + 150, row_y, str(damage))
-                c.drawString(x + 250, row_y, weapon_type)
+        c.setFillColor(colors.black)
+        c.setFont("Helvetica-Bold", 10)
+        c.drawString(x + 10, y + height - 15, "INVENTORY")
 
-    def draw_spellbook(self, c, x, y, data, character_data, width, height):
-        """Draw the spellbook page with organized spells"""
-        # Get spell slots for this character
-        spell_slots = data.get("Spell Slots", {})
-        selected_spells = data.get("Selected Spells", [])
+    def draw_inventory(self, c, inventory, x, y, height=70):
+        """Draw inventory items in columns"""
+        inventory_items = inventory.split(', ')
+        items_per_column = 3
+        col_width = 130
 
-        if not selected_spells:
-            c.setFont("Helvetica", 12)
-            c.drawString(x, y, "No spells known.")
-            return
+        cells = []
+        for i, item in enumerate(inventory_items[:12]):  # Limit to 12 items
+            if item.strip():
+                col = i // items_per_column
+                row = i % items_per_column
+                item_x = x + 10 + (col * col_width)
+                item_y = y + height - 30 - (row * 12)
+                cells.append((item_x, item_y, f"• {item.strip()}"))
+        if cells:
+            c.setFillColor(colors.black)
+            self.draw_strings(c, cells, "Helvetica", 8)
 
-        # Show spell slots
-        slots_y = y
-        c.setFont("Helvetica-Bold", 12)
-        c.drawString(x, slots_y, "SPELL SLOTS")
+    def draw_blank_page(self, c, width, height):
+        """Fill the page with the white background"""
+        c.setFillColor(colors.white)
+        c.rect(0, 0, width, height, fill=1)
+
+    def draw_page(self, c, page, data):
+        """Draw a compiled layout page: its static form, then the character's values"""
+        self.draw_template(c, page.form_name, lambda t: self.draw_page_template(t, page))
+        for func, kwargs, getter in page.values:
+            func(c, getter(data), **kwargs)
+
+    def draw_page_template(self, c, page):
+        """All static artwork of a compiled layout page"""
+        self.draw_blank_page(c, *self.layout.page_size)
+        for func, kwargs in page.template:
+            func(c, **kwargs)
+
+    # Spellbook geometry shared by the layout and drawing passes
+    SPELL_CARD_MIN_HEIGHT = 80
+    SPELL_CARD_HEADER_HEIGHT = 60
+    SPELL_CARD_CONTINUED_HEADER_HEIGHT = 30
+    SPELL_CARD_LINE_HEIGHT = 10
+    SPELL_CARD_GAP = 20
+    SPELL_LEVEL_HEADER_HEIGHT = 25
+    SPELL_LEVEL_GAP = 10
+    SPELLBOOK_BOTTOM_MARGIN = 50
+
+    def measure_spell_card(self, spell_name, spell_data, max_width):
+        """Wrap a spell's full description and size its card to fit"""
+        lines = wrap_text(spell_data['description'], max_width - 40, "Helvetica", 8)  # Account for margins
+        # Name and details, then one row per description line
+        card_height = max(self.SPELL_CARD_MIN_HEIGHT,
+                          self.SPELL_CARD_HEADER_HEIGHT + self.SPELL_CARD_LINE_HEIGHT * len(lines))
+        # Named by a hash of the spell, as sanitized names can collide ("Cure Wounds", "Cure_Wounds")
+        spell_hash = hashlib.sha256(json.dumps([spell_name, spell_data], sort_keys=True).encode("utf-8")).hexdigest()
+        form_name = f"dc20_spell_{spell_hash[:24]}_{max_width:g}x{card_height}"
+        return SpellCard(spell_name, spell_data, lines, card_height, 0, form_name)
+
+    def split_spell_card(self, card, space):
+        """Split a card's description so its first part fills space, returning (part, rest).
+
+        rest continues the description on the next page under a
+        "(continued)" title. part is None if no line fits, or all of them do.
+        """
+        header = self.SPELL_CARD_CONTINUED_HEADER_HEIGHT if card.first_line else self.SPELL_CARD_HEADER_HEIGHT
+        count = int((space - header) // self.SPELL_CARD_LINE_HEIGHT)
+        if count < 1 or count >= len(card.lines):
+            return None, card
+        # Parts are named after the whole card's form by where they start and their height
+        whole_form = card.form_name.rpartition("_")[0] if card.first_line else card.form_name
+        part_height = header + self.SPELL_CARD_LINE_HEIGHT * count
+        part = card._replace(lines=card.lines[:count], height=part_height,
+                             form_name=f"{whole_form}_{card.first_line}x{part_height}")
+        rest_lines = card.lines[count:]
+        rest_height = self.SPELL_CARD_CONTINUED_HEADER_HEIGHT + self.SPELL_CARD_LINE_HEIGHT * len(rest_lines)
+        rest = card._replace(lines=rest_lines, height=rest_height, first_line=card.first_line + count,
+                             form_name=f"{whole_form}_{card.first_line + count}x{rest_height}")
+        return part, rest
+
+    def layout_spellbook(self, data, spell_database, book):
+        """First pass: paginate the spellbook without drawing anything.
+
+        book holds the layout's spellbook settings. Returns one list per page
+        of (kind, y, item) placements, where kind is "slots" (item is the slot
+        summary), "level" (item is the heading) or "spell" (item is a
+        SpellCard). Page 1 starts below the page title; continuation pages
+        start below their "(continued)" header. A card too tall for a page is
+        split, its description continuing at the top of the next one.
+        """
+        spell_slots = data.get("Spell Slots", {})
+        selected_spells = data.get("Selected Spells", [])
+        max_width = book["card_width"]
 
+        # Saved characters come back from JSON with the slot levels as strings
         slots_text = []
-        for level, count in sorted(spell_slots.items()):
+        for level, count in sorted((int(level), count) for level, count in spell_slots.items()):
             if level == 0:
                 slots_text.append(f"Cantrips: {count}")
             else:
                 slots_text.append(f"Level {level}: {count}")
 
-        c.setFont("Helvetica", 10)
-        c.drawString(x, slots_y - 20, " | ".join(slots_text))
-
         # Organize spells by level
         spells_by_level = {}
         for spell_name in selected_spells:
-            if spell_name in character_data.spell_database:
-                spell_data = character_data.spell_database[spell_name]
-                level = spell_data["level"]
-                if level not in spells_by_level:
-                    spells_by_level[level] = []
-                spells_by_level[level].append((spell_name, spell_data))
+            if spell_name in spell_database:
+                spell_data = spell_database[spell_name]
+                spells_by_level.setdefault(spell_data["level"], []).append(
+                    self.measure_spell_card(spell_name, spell_data, max_width))
 
-        # Draw spells by level
-        current_y = slots_y - 60
+        page = [("slots", book["y"], " | ".join(slots_text))]
+        pages = [page]
+        current_y = book["y"] - 60
 
         for level in sorted(spells_by_level.keys()):
-            spells = spells_by_level[level]
-
-            # Level header
-            c.setFont("Helvetica-Bold", 14)
             level_text = "CANTRIPS (0 LEVEL)" if level == 0 else f"LEVEL {level} SPELLS"
-            c.drawString(x, current_y, level_text)
-            current_y -= 25
-
-            # Draw spells for this level
-            for spell_name, spell_data in spells:
-                current_y = self.draw_spell_entry(c, x, current_y, spell_name, spell_data, width - 100)
-                current_y -= 20  # Space between spells
-
-                # Check if we need a new page
-                if current_y < 100:
-                    c.showPage()
-                    c.setFillColor(colors.white)
-                    c.rect(0, 0, width, height, fill=1)
-
-                    # Continue header
-                    c.setFillColor(colors.black)
+            heading_pending = True
+
+            for card in spells_by_level[level]:
+                needed = card.height + (self.SPELL_LEVEL_HEADER_HEIGHT if heading_pending else 0)
+                space = current_y - book["bottom_margin"]
+                # A card taller than a whole page is split, starting here if a card's worth of it fits
+                split_here = (needed > book["continued_y"] - book["bottom_margin"]
+                              and space - (needed - card.height) >= self.SPELL_CARD_MIN_HEIGHT)
+                # Start a new page rather than overflow; a heading stays with its first card
+                if needed > space and not split_here and len(page) > 1:
+                    page = []
+                    pages.append(page)
+                    current_y = book["continued_y"]
+
+                if heading_pending:
+                    page.append(("level", current_y, level_text))
+                    current_y -= self.SPELL_LEVEL_HEADER_HEIGHT
+                    heading_pending = False
+
+                while current_y - card.height < book["bottom_margin"]:
+                    part, card = self.split_spell_card(card, current_y - book["bottom_margin"])
+                    if part is None:
+                        break
+                    page.append(("spell", current_y, part))
+                    page = []
+                    pages.append(page)
+                    current_y = book["continued_y"]
+
+                page.append(("spell", current_y, card))
+                current_y -= card.height + self.SPELL_CARD_GAP
+
+            current_y -= self.SPELL_LEVEL_GAP  # Extra space between spell levels
+
+        return pages
+
+    def page_count(self, data, spell_database):
+        """Number of pages the sheet for data will take, without rendering it"""
+        count = 0
+        for page in self.layout.pages:
+            if page.spellbook is None:
+                count += 1
+            elif data.get("Selected Spells"):
+                count += len(self.layout_spellbook(data, spell_database, page.spellbook))
+        return count
+
+    def draw_spellbook(self, c, book, data, spell_database, share_spell_cards=False):
+        """Second pass: draw the laid-out spellbook pages"""
+        x = book["x"]
+        for page_number, page in enumerate(self.layout_spellbook(data, spell_database, book)):
+            if page_number:
+                c.showPage()
+                self.draw_page(c, book["continued"], data)
+
+            for kind, y, item in page:
+                c.setFillColor(colors.black)
+                if kind == "slots":
+                    c.setFont("Helvetica-Bold", 12)
+                    c.drawString(x, y, "SPELL SLOTS")
+                    c.setFont("Helvetica", 10)
+                    c.drawString(x, y - 20, item)
+                elif kind == "level":
                     c.setFont("Helvetica-Bold", 14)
-                    c.drawString(50, height - 50, f"{data.get('Name', 'Character')} - Spellbook (continued)")
-                    current_y = height - 80
-
-            current_y -= 10  # Extra space between spell levels
-
-    def draw_spell_entry(self, c, x, y, spell_name, spell_data, max_width):
-        """Draw a single spell entry"""
-        entry_height = 80
-
-        # Spell border
-        self.draw_hexagonal_border(c, x, y - entry_height, max_width, entry_height)
+                    c.drawString(x, y, item)
+                else:
+                    self.draw_spell_entry(c, x, y, item, book["card_width"], share_spell_cards)
+
+    def draw_spell_entry(self, c, x, y, card, max_width, as_form=False):
+        """Draw a measured spell card with its top-left corner at (x, y)"""
+        if not as_form:
+            self.draw_spell_card(c, x, y, card, max_width)
+            return y - card.height
+
+        # A spell's card looks the same on every sheet, so a document with
+        # many sheets records it once and places it as a form. The form is
+        # drawn inset by a margin so the border stroke isn't clipped at its
+        # bounding box.
+        margin = 2
+        c.saveState()
+        c.translate(x - margin, y - card.height - margin)
+        self.draw_template(c, card.form_name,
+                           lambda t: self.draw_spell_card(t, margin, margin + card.height, card, max_width))
+        c.restoreState()
+
+        return y - card.height
+
+    def draw_spell_card(self, c, x, y, card, max_width):
+        """Draw a spell's bordered card with its top-left corner at (x, y)"""
+        spell_data = card.spell
+        self.draw_hexagonal_border(c, x, y - card.height, max_width, card.height)
 
         # Spell name
         c.setFont("Helvetica-Bold", 12)
         c.setFillColor(colors.black)
-        c.drawString(x + 10, y - 15, spell_name.upper())
+        if card.first_line:
+            # The rest of a description split across pages
+            c.drawString(x + 10, y - 15, f"{card.name.upper()} (CONTINUED)")
+            self.draw_strings(c, [(x + 10, y - 30 - (i * 10), line) for i, line in enumerate(card.lines)],
+                              "Helvetica", 8)
+            return
 
-        # Spell details in smaller text
-        c.setFont("Helvetica", 9)
+        # Spell details in smaller text: school and casting info, then range
         details_y = y - 30
+        self.draw_strings(c, [
+            (x + 10, details_y, f"School: {spell_data['school']} | Casting Time: {spell_data['casting_time']}"),
+            (x + 10, details_y - 12, f"Range: {spell_data['range']} | Duration: {spell_data['duration']}"),
+        ], "Helvetica", 9)
 
-        # School and casting info
-        details_line1 = f"School: {spell_data['school']} | Casting Time: {spell_data['casting_time']}"
-        c.drawString(x + 10, details_y, details_line1)
-
-        details_line2 = f"Range: {spell_data['range']} | Duration: {spell_data['duration']}"
-        c.drawString(x + 10, details_y - 12, details_line2)
-
-        # Description (wrapped)
+        # Full wrapped description
         desc_y = details_y - 30
-        c.setFont("Helvetica", 8)
-        description = spell_data['description']
-
-        # Simple text wrapping
-        words = description.split()
-        lines = []
-        current_line = []
-        line_width = 0
-        max_line_width = max_width - 40  # Account for margins
-
-        for word in words:
-            word_width = c.stringWidth(word + " ", "Helvetica", 8)
-            if line_width + word_width <= max_line_width:
-                current_line.append(word)
-                line_width += word_width
-            else:
-                if current_line:
-                    lines.append(" ".join(current_line))
-                current_line = [word]
-                line_width = word_width
-
-        if current_line:
-            lines.append(" ".join(current_line))
-
-        # Draw description lines
-        for i, line in enumerate(lines[:2]):  # Limit to 2 lines to fit in box
-            c.drawString(x + 10, desc_y - (i * 10), line)
-
-        return y - entry_height
+        self.draw_strings(c, [(x + 10, desc_y - (i * 10), line) for i, line in enumerate(card.lines)],
+                          "Helvetica", 8)
 
     def export_to_pdf(self, data, character_data):
         """Export character data to PDF with authentic DC20 styling"""
         file_name = data.get("Name", "Character") + ".pdf"
-        c = canvas.Canvas(file_name, pagesize=letter)
-        width, height = letter
-
-        # === PAGE 1 CONTENT ONLY ===
-        # White background
-        c.setFillColor(colors.white)
-        c.rect(0, 0, width, height, fill=1)
-
-        # === HEADER SECTION ===
-        self.draw_dc20_header(c, width, height, data)
-
-        # === HEALTH AND RESOURCES ===
-        resources_y = height - 200
-        self.draw_resources_section(c, 50, resources_y, data)
-
-        # === PRIME ATTRIBUTE ===
-        prime_x = 450
-        prime_y = resources_y  # Same Y level as health points and resources
-        self.draw_prime_hexagon(c, prime_x, prime_y)
-
-        # Add prime value
-        c.setFillColor(colors.black)
-        c.setFont("Helvetica-Bold", 28)
-        prime_value = str(data.get("Prime", 0))
-        prime_width = c.stringWidth(prime_value, "Helvetica-Bold", 28)
-        c.drawString(prime_x + 40 - prime_width / 2, prime_y + 35, prime_value)
-
-        # === ATTRIBUTES SECTION ===
-        attr_y = height - 350
-        attr_spacing = 115
-
-        # Draw four attribute hexagons
-        attr_names = ["Might", "Agility", "Charisma", "Intelligence"]
-        for i, attr_name in enumerate(attr_names):
-            attr_x = 50 + (i * attr_spacing)
-            attr_value = data.get(attr_name, 0)
-            self.draw_attribute_hexagon(c, attr_x, attr_y, attr_name, attr_value)
-
-        # === SKILLS SECTION ===
-        skills_y = attr_y - 180
-
-        # Parse and group skills
-        skills_by_attr = {
-            "Might": [], "Agility": [], "Charisma": [], "Intelligence": []
-        }
-
-        skill_to_attr_map = {}
-        for skill_name, attr_name in character_data.skill_names:
-            skill_to_attr_map[skill_name] = attr_name
-
-        skill_entries = data["Skills"].split(', ')
-        for entry in skill_entries:
-            if ':' in entry:
-                skill_name = entry.split(':')[0].strip()
-                skill_value = entry.split(':')[1].split('(')[0].strip()
-                training = entry.split('(')[1].replace(')', '') if '(' in entry else "None"
-
-                if skill_name in skill_to_attr_map:
-                    attr_name = skill_to_attr_map[skill_name]
-                    skills_by_attr[attr_name].append((skill_name, skill_value, training))
-
-        # Draw skill columns
-        for i, (attr_name, skills_data) in enumerate(skills_by_attr.items()):
-            skill_x = 50 + (i * attr_spacing)
-            self.draw_skill_column(c, skill_x, skills_y, attr_name, skills_data)
-
-        # === END PAGE 1 / START PAGE 2 ===
-        c.showPage()
-
-        # === PAGE 2 SETUP ===
-        c.setFillColor(colors.white)
-        c.rect(0, 0, width, height, fill=1)
-
-        # Page 2 header
-        c.setFillColor(colors.black)
-        c.setFont("Helvetica-Bold", 16)
-        page2_title = f"{data.get('Name', 'Character')} - Combat & Equipment"
-        c.drawString(50, height - 50, page2_title)
-
-        # Separator line
-        c.setStrokeColor(colors.black)
-        c.setLineWidth(2)
-        c.line(50, height - 65, width - 50, height - 65)
-
-        # === COMBAT SECTION (Page 2) ===
-        combat_y_p2 = height - 150  # Moved down 2 lines (30 points)
-        self.draw_combat_section(c, 50, combat_y_p2, data)
-
-        # === ATTACKS SECTION (Page 2) ===
-        attacks_y_p2 = combat_y_p2 - 135  # Moved down 1 line (15 points)  # Maintains relative spacing
-        weapons = character_data.parse_weapons_from_inventory(
-            data.get("Inventory", ""),
-            data.get("Class", ""),
-            data.get("Might", 0),
-            data.get("Agility", 0),
-            data.get("Combat Mastery", 0)
-        )
-        self.draw_attacks_table(c, 50, attacks_y_p2, weapons)
-
-        # === INVENTORY SECTION (Page 2) ===
-        inv_y_p2 = attacks_y_p2 - 150  # Maintain relative spacing
-        inv_width = 450
-        inv_height = 70
-
-        self.draw_hexagonal_border(c, 50, inv_y_p2, inv_width, inv_height)
-        c.setFillColor(colors.white)
-        c.rect(52, inv_y_p2 + 2, inv_width - 4, inv_height - 4, fill=1, stroke=0)
-
-        # Inventory title
-        c.setFillColor(colors.black)
-        c.setFont("Helvetica-Bold", 10)
-        c.drawString(60, inv_y_p2 + inv_height - 15, "INVENTORY")
-
-        # Inventory items in columns
-        c.setFont("Helvetica", 8)
-        inventory_items = data.get("Inventory", "").split(', ')
-        items_per_column = 3
-        col_width = 130
-
-        for i, item in enumerate(inventory_items[:12]):  # Limit to 12 items
-            if item.strip():
-                col = i // items_per_column
-                row = i % items_per_column
-                item_x = 60 + (col * col_width)
-                item_y = inv_y_p2 + inv_height - 30 - (row * 12)
-                c.drawString(item_x, item_y, f"• {item.strip()}")
-
-        # Test text to verify page 2
-        c.setFont("Helvetica", 10)
-        c.drawString(50, 50, "This is Page 2 - Combat & Equipment")
-
-        # === START PAGE 3 (SPELLBOOK) ===
-        if data.get("Selected Spells") and len(data.get("Selected Spells", [])) > 0:
-            c.showPage()
-
-            # === PAGE 3 SETUP ===
-            c.setFillColor(colors.white)
-            c.rect(0, 0, width, height, fill=1)
-
-            # Page 3 header
-            c.setFillColor(colors.black)
-            c.setFont("Helvetica-Bold", 16)
-            page3_title = f"{data.get('Name', 'Character')} - Spellbook"
-            c.drawString(50, height - 50, page3_title)
-
-            # Separator line
-            c.setStrokeColor(colors.black)
-            c.setLineWidth(2)
-            c.line(50, height - 65, width - 50, height - 65)
-
-            # Draw spellbook content
-            self.draw_spellbook(c, 50, height - 100, data, character_data, width, height)
-
-        c.save()
+        self.write_sheet(data, file_name, character_data.spell_database)
         print(f"Enhanced DC20 character sheet saved as {file_name}")
-        return True
\ No newline at end of file
+        return True
+
+    def write_sheet(self, data, file_name, spell_database):
+        """Render one character sheet to file_name"""
+        with open(file_name, 'wb') as f:
+            self.render_pdf(data, f, spell_database=spell_database)
+
+    def render_pdf(self, data, stream=None, *, spell_database):
+        """Render one character sheet entirely in memory.
+
+        Writes the PDF to stream (any binary file-like object) if one is given,
+        otherwise returns it as bytes. Nothing is printed and the filesystem is
+        only touched for the render cache, when one is configured. Like every
+        render entry point, it takes the spell database from the caller rather
+        than reading data/spells.json itself (see load_spell_database).
+        """
+        key = pdf = None
+        if self.render_cache:
+            # Compressed and uncompressed renders of a sheet are different files
+            key = sheet_key(data, spell_database, (LAYOUT_VERSION, self.layout.digest, self.compress))
+            pdf = self.render_cache.get(key)
+
+        if pdf is None:
+            buffer = io.BytesIO()
+            c = self.new_canvas(buffer)
+            self.draw_character_sheet(c, data, spell_database)
+            c.save()
+            pdf = buffer.getvalue()
+            if key:
+                self.render_cache.put(key, pdf)
+
+        if stream is None:
+            return pdf
+        stream.write(pdf)
+
+    def measure_sheet(self, data, spell_database):
+        """Output size and drawing cost of one sheet rendered on its own.
+
+        Returns a dict with "bytes" (the PDF as render_pdf produces it) and,
+        from an uncompressed render, "stream_bytes" and "ops": the size and
+        operator count of all page and form content streams.
+        """
+        buffer = io.BytesIO()
+        c = self.new_canvas(buffer, compress=False)
+        self.draw_character_sheet(c, data, spell_database)
+        c.save()
+
+        stats = content_stream_stats(buffer.getvalue())
+        if self.compress:
+            buffer = io.BytesIO()
+            c = self.new_canvas(buffer)
+            self.draw_character_sheet(c, data, spell_database)
+            c.save()
+        return {"bytes": len(buffer.getvalue()), "stream_bytes": stats["stream_bytes"], "ops": stats["ops"]}
+
+    def render_svg(self, data, spell_database):
+        """Render one character sheet in memory as a list of SVG page documents"""
+        backend = SVGBackend(self.layout.page_size)
+        self.draw_character_sheet(backend, data, spell_database)
+        return [backend.to_svg(page) for page in range(len(backend.pages))]
+
+    def draw_preview(self, tk_canvas, data, page=0, scale=1.0, *, spell_database):
+        """Draw one page of a character sheet onto a tkinter Canvas.
+
+        Nothing is written to disk. page is clamped to the pages the sheet
+        has; returns the page count so callers can offer paging.
+        """
+        backend = TkCanvasBackend(self.layout.page_size)
+        self.draw_character_sheet(backend, data, spell_database)
+        page_total = len(backend.pages)
+        backend.draw_page(tk_canvas, min(max(page, 0), page_total - 1), scale)
+        return page_total
+
+    def export_roster(self, characters, file_name="Roster.pdf", *, spell_database, sheets_per_volume=None):
+        """Export any iterable of character dicts as one combined roster book.
+
+        All sheets share one canvas, so fonts and page templates are embedded
+        once per book, and each character gets a bookmark in the outline.
+        Characters are consumed one at a time; reportlab keeps a finished
+        document in memory until it is saved, so sheets_per_volume can split
+        very large rosters into "<name>-001.pdf", "<name>-002.pdf", ... books,
+        bounding memory to one volume. Returns the list of files written.
+        """
+
+        stem = file_name[:-4] if file_name.lower().endswith(".pdf") else file_name
+        written = []
+        c = None
+        sheet_count = 0
+
+        for data in characters:
+            if c is None:
+                volume_name = f"{stem}-{len(written) + 1:03d}.pdf" if sheets_per_volume else f"{stem}.pdf"
+                c = self.new_canvas(volume_name, compress=True)
+                c.setTitle(stem)
+                c.showOutline()
+            elif sheet_count:
+                c.showPage()
+
+            self.draw_character_sheet(c, data, spell_database, bookmark=f"sheet{sheet_count}",
+                                      share_spell_cards=True)
+            sheet_count += 1
+
+            if sheets_per_volume and sheet_count == sheets_per_volume:
+                c.save()
+                written.append(volume_name)
+                c = None
+                sheet_count = 0
+
+        if c is not None:
+            c.save()
+            written.append(volume_name)
+
+        if written:
+            print(f"Roster book saved as {', '.join(written)}")
+        else:
+            print("No characters to export")
+        return written
+
+    def draw_character_sheet(self, c, data, spell_database, bookmark=None, share_spell_cards=False):
+        """Draw every page of one character sheet, leaving the last page open.
+
+        With a bookmark key, the sheet is added to the document outline with
+        its pages nested under the character's name. share_spell_cards records
+        spell cards as forms that later sheets of the same document reuse;
+        a single sheet draws them inline, as each card appears only once.
+        """
+        if bookmark:
+            c.bookmarkPage(bookmark)
+            c.addOutlineEntry(data.get("Name", "Character"), bookmark, level=0, closed=True)
+
+        first_page = True
+        for page_number, page in enumerate(self.layout.pages):
+            # The spellbook is only printed for characters with spells
+            if page.spellbook is not None and not data.get("Selected Spells"):
+                continue
+
+            if not first_page:
+                c.showPage()
+            first_page = False
+
+            if bookmark and page.bookmark:
+                page_key = f"{bookmark}.{page_number}"
+                c.bookmarkPage(page_key)
+                c.addOutlineEntry(page.bookmark, page_key, level=1)
+
+            self.draw_page(c, page, data)
+            if page.spellbook is not None:
+                self.draw_spellbook(c, page.spellbook, data, spell_database, share_spell_cards)
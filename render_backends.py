@@ -0,0 +1,255 @@
+from xml.sax.saxutils import escape
+
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+# Fraction of the font size that glyphs descend below the baseline, used to
+# place baseline-anchored text on surfaces that anchor on the text box
+TEXT_DESCENT = 0.21
+
+
+class SheetBackend:
+    """Drawing surface that PDFGenerator's draw routines render onto.
+
+    This is the subset of the reportlab Canvas API the sheet uses, so
+    sheet_canvas.SheetCanvas is the PDF backend as is. Coordinates are PDF
+    points with the origin at the bottom-left of the page.
+
+    Methods: setFillColor, setStrokeColor, setLineWidth, setFont,
+    stringWidth, drawString, drawRightString, rect, line, lines, beginPath
+    (a path with moveTo, lineTo, rect and close), drawPath, beginText (a
+    text object with setTextOrigin and textOut), drawText, saveState,
+    restoreState, translate, showPage, hasForm, beginForm, endForm, doForm,
+    bookmarkPage and addOutlineEntry.
+    """
+
+
+class _Path:
+    """Subpaths collected by DisplayListBackend.beginPath"""
+
+    def __init__(self):
+        self.subpaths = []
+
+    def moveTo(self, x, y):
+        self.subpaths.append(([(x, y)], False))
+
+    def lineTo(self, x, y):
+        self.subpaths[-1][0].append((x, y))
+
+    def rect(self, x, y, width, height):
+        self.subpaths.append(([(x, y), (x + width, y), (x + width, y + height), (x, y + height)], True))
+
+    def close(self):
+        points, _ = self.subpaths[-1]
+        self.subpaths[-1] = (points, True)
+
+
+class _TextObject:
+    """Text runs collected by DisplayListBackend.beginText"""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.runs = []
+        self.x = self.y = 0
+
+    def setTextOrigin(self, x, y):
+        self.x, self.y = x, y
+
+    def textOut(self, text):
+        self.runs.append((self.x, self.y, text))
+        self.x += self.backend.stringWidth(text, self.backend.font, self.backend.font_size)
+
+
+class DisplayListBackend(SheetBackend):
+    """SheetBackend that records each page as a list of drawing items.
+
+    Items are ("path", subpaths, stroke, fill, line_width) with subpaths as
+    [(points, closed)], and ("text", x, y, text, font, size, color, anchor).
+    Colors are "#rrggbb" strings or None. Forms are kept as item lists and
+    replayed at the current translation, like PDF form XObjects.
+    """
+
+    def __init__(self, page_size):
+        self.page_size = page_size
+        self.pages = [[]]
+        self.forms = {}
+        self._items = self.pages[0]
+        self._state_stack = []
+        self._form_stack = []
+        self._reset_state()
+
+    def _reset_state(self):
+        self.fill = self.stroke = "#000000"
+        self.line_width = 1
+        self.font, self.font_size = "Helvetica", 12
+        self.dx = self.dy = 0
+
+    def _state(self):
+        return (self.fill, self.stroke, self.line_width, self.font, self.font_size, self.dx, self.dy)
+
+    @staticmethod
+    def _color(color):
+        return "#" + color.hexval()[2:]
+
+    # Graphics state
+
+    def setFillColor(self, color, alpha=None):
+        self.fill = self._color(color)
+
+    def setStrokeColor(self, color, alpha=None):
+        self.stroke = self._color(color)
+
+    def setLineWidth(self, width):
+        self.line_width = width
+
+    def setFont(self, font, size, leading=None):
+        self.font, self.font_size = font, size
+
+    def stringWidth(self, text, font=None, size=None):
+        return stringWidth(text, font or self.font, size or self.font_size)
+
+    def saveState(self):
+        self._state_stack.append(self._state())
+
+    def restoreState(self):
+        self.fill, self.stroke, self.line_width, self.font, self.font_size, self.dx, self.dy = self._state_stack.pop()
+
+    def translate(self, dx, dy):
+        self.dx += dx
+        self.dy += dy
+
+    # Shapes and text
+
+    def beginPath(self):
+        return _Path()
+
+    def drawPath(self, path, stroke=1, fill=0, **kwargs):
+        subpaths = [([(x + self.dx, y + self.dy) for x, y in points], closed) for points, closed in path.subpaths]
+        self._items.append(("path", subpaths, self.stroke if stroke else None, self.fill if fill else None,
+                            self.line_width))
+
+    def rect(self, x, y, width, height, stroke=1, fill=0):
+        path = _Path()
+        path.rect(x, y, width, height)
+        self.drawPath(path, stroke, fill)
+
+    def line(self, x1, y1, x2, y2):
+        self.lines([(x1, y1, x2, y2)])
+
+    def lines(self, line_list):
+        path = _Path()
+        for x1, y1, x2, y2 in line_list:
+            path.moveTo(x1, y1)
+            path.lineTo(x2, y2)
+        self.drawPath(path)
+
+    def _text(self, x, y, text, anchor):
+        self._items.append(("text", x + self.dx, y + self.dy, text, self.font, self.font_size, self.fill, anchor))
+
+    def drawString(self, x, y, text, **kwargs):
+        self._text(x, y, text, "start")
+
+    def drawRightString(self, x, y, text, **kwargs):
+        self._text(x, y, text, "end")
+
+    def beginText(self, x=0, y=0):
+        text = _TextObject(self)
+        text.setTextOrigin(x, y)
+        return text
+
+    def drawText(self, text):
+        for x, y, run in text.runs:
+            self._text(x, y, run, "start")
+
+    # Pages, forms and outline
+
+    def showPage(self):
+        self._items = []
+        self.pages.append(self._items)
+        self._reset_state()
+
+    def hasForm(self, name):
+        return name in self.forms
+
+    def beginForm(self, name, *args, **kwargs):
+        self._form_stack.append((self._items, self._state()))
+        self._items = self.forms[name] = []
+        self._reset_state()
+
+    def endForm(self, **kwargs):
+        self._items, state = self._form_stack.pop()
+        self.fill, self.stroke, self.line_width, self.font, self.font_size, self.dx, self.dy = state
+
+    def doForm(self, name):
+        dx, dy = self.dx, self.dy
+        for item in self.forms[name]:
+            if item[0] == "path":
+                subpaths = [([(x + dx, y + dy) for x, y in points], closed) for points, closed in item[1]]
+                self._items.append(("path", subpaths) + item[2:])
+            else:
+                self._items.append(("text", item[1] + dx, item[2] + dy) + item[3:])
+
+    def bookmarkPage(self, key, **kwargs):
+        pass
+
+    def addOutlineEntry(self, title, key, level=0, closed=None):
+        pass
+
+
+def _font_style(font):
+    """(family, bold, italic) of a standard PDF font name"""
+    family, _, style = font.partition("-")
+    return family, "Bold" in style, "Oblique" in style or "Italic" in style
+
+
+class SVGBackend(DisplayListBackend):
+    """Renders sheet pages as standalone SVG documents"""
+
+    def to_svg(self, page=0):
+        """SVG markup of one page"""
+        width, height = self.page_size
+        parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:g}" height="{height:g}" '
+                 f'viewBox="0 0 {width:g} {height:g}">']
+        for item in self.pages[page]:
+            if item[0] == "path":
+                _, subpaths, stroke, fill, line_width = item
+                d = " ".join(
+                    "M" + " L".join(f"{x:g},{height - y:g}" for x, y in points) + (" Z" if closed else "")
+                    for points, closed in subpaths)
+                parts.append(f'<path d="{d}" fill="{fill or "none"}" stroke="{stroke or "none"}" '
+                             f'stroke-width="{line_width:g}"/>')
+            else:
+                _, x, y, text, font, size, color, anchor = item
+                family, bold, italic = _font_style(font)
+                weight = "bold" if bold else "normal"
+                style = "italic" if italic else "normal"
+                parts.append(f'<text x="{x:g}" y="{height - y:g}" font-family="{family}, sans-serif" '
+                             f'font-size="{size:g}" font-weight="{weight}" font-style="{style}" fill="{color}" '
+                             f'text-anchor="{anchor}" xml:space="preserve">{escape(text)}</text>')
+        parts.append("</svg>")
+        return "\n".join(parts)
+
+
+class TkCanvasBackend(DisplayListBackend):
+    """Draws sheet pages onto a tkinter Canvas, scaled to fit a preview"""
+
+    def draw_page(self, tk_canvas, page=0, scale=1.0):
+        """Replace the contents of tk_canvas with one page"""
+        height = self.page_size[1]
+        tk_canvas.delete("all")
+        for item in self.pages[page]:
+            if item[0] == "path":
+                _, subpaths, stroke, fill, line_width = item
+                width = max(1, line_width * scale)
+                for points, closed in subpaths:
+                    coords = [value for x, y in points for value in (x * scale, (height - y) * scale)]
+                    if closed:
+                        tk_canvas.create_polygon(coords, fill=fill or "", outline=stroke or "", width=width)
+                    elif stroke:
+                        tk_canvas.create_line(coords, fill=stroke, width=width)
+            else:
+                _, x, y, text, font, size, color, anchor = item
+                family, bold, italic = _font_style(font)
+                style = " ".join(s for s, on in (("bold", bold), ("italic", italic)) if on) or "normal"
+                tk_canvas.create_text(x * scale, (height - y + size * TEXT_DESCENT) * scale, text=text,
+                                      anchor="sw" if anchor == "start" else "se", fill=color,
+                                      font=(family, -max(1, round(size * scale)), style))
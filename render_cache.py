@@ -0,0 +1,94 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+
+def sheet_key(data, spell_database, layout_version):
+    """Stable hash of everything a rendered sheet depends on.
+
+    Covers the character dict, the database entries of the selected spells
+    (so editing a spell invalidates only the sheets that show it) and the
+    layout version of the renderer.
+    """
+    spells = {name: spell_database[name] for name in data.get("Selected Spells") or () if name in spell_database}
+    payload = json.dumps([layout_version, data, spells], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """On-disk cache of rendered sheets keyed by content hash.
+
+    Entries are whole PDF files. Each hit refreshes the file's mtime, and
+    when the cache grows past max_bytes the least recently used files are
+    evicted. Writes go through a temp file and rename, so several processes
+    can share one cache directory.
+    """
+
+    def __init__(self, cache_dir, max_bytes=256 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._total_size = None
+
+    def _entry(self, key):
+        return self.cache_dir / f"{key}.pdf"
+
+    def get(self, key):
+        """Cached PDF bytes for key, or None on a miss"""
+        entry = self._entry(key)
+        try:
+            pdf = entry.read_bytes()
+            os.utime(entry)
+            return pdf
+        except FileNotFoundError:
+            return None
+
+    def put(self, key, pdf):
+        """Add freshly rendered PDF bytes to the cache, returning False if it couldn't be written"""
+        entry = self._entry(key)
+        tmp_file = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        try:
+            tmp_file.write_bytes(pdf)
+            os.replace(tmp_file, entry)
+        except OSError:
+            return False
+
+        if self._total_size is None:
+            self._total_size = self.total_size()
+        else:
+            self._total_size += len(pdf)
+        if self._total_size > self.max_bytes:
+            self.evict()
+        return True
+
+    def total_size(self):
+        """Bytes currently used by cached sheets"""
+        return sum(size for _, size, _ in self._scan())
+
+    def evict(self):
+        """Delete least recently used sheets until the cache fits in max_bytes"""
+        entries = sorted(self._scan())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass  # Already evicted by another process
+            total -= size
+        self._total_size = total
+
+    def _scan(self):
+        """(mtime, size, path) of every cached sheet"""
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".pdf"):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        return entries
@@ -0,0 +1,92 @@
+import re
+import zlib
+
+from reportlab.pdfgen import canvas
+
+_UNSET = object()
+
+_STREAM_PATTERN = re.compile(rb"<<(.*?)>>\s*stream\r?\n(.*?)endstream", re.S)
+_STRING_PATTERN = re.compile(rb"\((?:\\.|[^\\)])*\)")
+_OPERATOR_PATTERN = re.compile(rb"(?<![/\w.])[A-Za-z'\"][A-Za-z*'\"]*")
+
+
+class SheetCanvas(canvas.Canvas):
+    """reportlab Canvas that drops graphics-state operators which change nothing.
+
+    Fill and stroke colors, line width and font are tracked per graphics
+    state (saveState/restoreState), per page and per form, and a setter
+    called with the value already in effect emits no operator.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._gstate = {}
+        self._gstate_stack = []
+        super().__init__(*args, **kwargs)
+
+    def _state_changes(self, key, value):
+        """Record value for key, returning False if it was already in effect"""
+        if self._gstate.get(key, _UNSET) == value:
+            return False
+        self._gstate[key] = value
+        return True
+
+    def setFillColor(self, aColor, alpha=None):
+        if alpha is None and not self._state_changes("fill", aColor):
+            return
+        super().setFillColor(aColor, alpha)
+
+    def setStrokeColor(self, aColor, alpha=None):
+        if alpha is None and not self._state_changes("stroke", aColor):
+            return
+        super().setStrokeColor(aColor, alpha)
+
+    def setLineWidth(self, width):
+        if self._state_changes("line_width", width):
+            super().setLineWidth(width)
+
+    def setFont(self, psfontname, size, leading=None):
+        if self._state_changes("font", (psfontname, size, leading)):
+            super().setFont(psfontname, size, leading)
+
+    def saveState(self):
+        self._gstate_stack.append(dict(self._gstate))
+        super().saveState()
+
+    def restoreState(self):
+        self._gstate = self._gstate_stack.pop()
+        super().restoreState()
+
+    def showPage(self):
+        super().showPage()
+        # A new page starts from the PDF defaults, whatever was set before
+        self._gstate = {}
+
+    def beginForm(self, *args, **kwargs):
+        # A form inherits the state of whichever page draws it, so nothing is known inside
+        self._gstate_stack.append(self._gstate)
+        self._gstate = {}
+        super().beginForm(*args, **kwargs)
+
+    def endForm(self, **extra_attributes):
+        super().endForm(**extra_attributes)
+        self._gstate = self._gstate_stack.pop()
+
+
+def content_stream_stats(pdf):
+    """Content stream size and operator count of an uncompressed PDF.
+
+    Counts every page and form XObject stream; images and fonts are
+    skipped. Returns a dict with "streams", "stream_bytes" and "ops".
+    """
+    stats = {"streams": 0, "stream_bytes": 0, "ops": 0}
+    for header, body in _STREAM_PATTERN.findall(pdf):
+        if b"/Filter" in header:
+            if b"/FlateDecode" not in header or b"ASCII85" in header:
+                continue
+            body = zlib.decompress(body)
+        if b"/Subtype /Image" in header or b"/Length1" in header:
+            continue
+        stats["streams"] += 1
+        stats["stream_bytes"] += len(body)
+        stats["ops"] += len(_OPERATOR_PATTERN.findall(_STRING_PATTERN.sub(b"()", body)))
+    return stats
@@ -0,0 +1,140 @@
+import hashlib
+import json
+import string
+from collections import namedtuple
+from pathlib import Path
+
+from character_model import health_points, parse_skills, parse_weapons_from_inventory
+
+LAYOUT_DIR = Path(__file__).resolve().parent / "layouts"
+DEFAULT_LAYOUT = "letter"
+
+# One compiled page. template holds (func, kwargs) ops for the static artwork,
+# values holds (func, kwargs, getter) ops drawn with getter(data) as their
+# first argument, with the values of every frame after the page's own. spellbook is None for fixed pages, otherwise the spellbook
+# flow settings with the continuation page under "continued".
+CompiledPage = namedtuple("CompiledPage", ["form_name", "template", "values", "bookmark", "spellbook"])
+
+# Values computed from several data keys, keyed by the slot name used in layouts
+SLOT_FUNCTIONS = {
+    "Sheet Name": lambda data: data.get("Name", "Character"),
+    "Class & Subclass": lambda data: (
+        data.get("Class", "") + (f" / {data['Subclass']}" if data.get("Subclass") else "")),
+    "Ancestry & Background": lambda data: f"{data.get('Ancestry', '')} / {data.get('Background', '')}",
+    "Health Points": lambda data: health_points(int(data.get("Level", 1)), int(data.get("Might", 0))),
+    "Skill Trainings": lambda data: parse_skills(data.get("Skills")),
+    "Attacks": lambda data: parse_weapons_from_inventory(
+        data.get("Inventory", ""), data.get("Class", ""), data.get("Might", 0),
+        data.get("Agility", 0), data.get("Combat Mastery", 0)),
+}
+
+# Defaults for plain data keys; anything else missing from the data shows 0
+SLOT_DEFAULTS = {"Name": "", "Player Name": "", "Level": 1, "Inventory": ""}
+
+
+def slot_value(data, slot):
+    """Value of a layout slot for a character dict"""
+    func = SLOT_FUNCTIONS.get(slot)
+    if func is not None:
+        return func(data)
+    return data.get(slot, SLOT_DEFAULTS.get(slot, 0))
+
+
+class _SlotValues:
+    """Mapping view of a character's slot values, for str.format_map"""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+    def __getitem__(self, slot):
+        return slot_value(self.data, slot)
+
+
+def text_slots(text):
+    """Names of the slots referenced by a "{Slot}" format string"""
+    return [field for _, field, _, _ in string.Formatter().parse(text) if field]
+
+
+def text_getter(text):
+    """Compile a "{Slot} ..." format string into a getter of data, or None for plain text"""
+    slots = text_slots(text)
+    if not slots:
+        return None
+    if text == "{" + slots[0] + "}":
+        slot = slots[0]
+        return lambda data: str(slot_value(data, slot))
+    return lambda data: text.format_map(_SlotValues(data))
+
+
+def load_layout_spec(name=DEFAULT_LAYOUT):
+    """Read a layout spec by name from layouts/, or from a path to a JSON file"""
+    path = Path(name)
+    if path.suffix != ".json":
+        path = LAYOUT_DIR / f"{name}.json"
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+class CompiledLayout:
+    """A declarative sheet layout compiled into flat per-page op lists.
+
+    Specs use points with y measured down from the top edge of the page. A
+    template op (a frame) may list the value ops drawn inside it under
+    "values", with x and y relative to the frame's own, so moving a frame
+    moves its values too. Compiling resolves those to page positions, flips
+    y to PDF coordinates and binds every op to its drawing component, so
+    rendering a sheet is a loop over ops with value substitution.
+    """
+
+    def __init__(self, spec, components):
+        self.name = spec["name"]
+        self.page_size = tuple(spec["page_size"])
+        self.digest = hashlib.sha256(json.dumps(spec, sort_keys=True).encode("utf-8")).hexdigest()
+        self.components = components
+        self.pages = [self._compile_page(page, i) for i, page in enumerate(spec["pages"])]
+
+    def _compile_page(self, page, page_index, suffix=""):
+        template = []
+        value_ops = list(page.get("values", []))
+        for op in page.get("template", []):
+            frame_values = op.get("values", [])
+            op = {key: value for key, value in op.items() if key != "values"}
+            template.append(self._compile_op(op))
+            for value_op in frame_values:
+                value_op = dict(value_op)
+                value_op["x"] = op["x"] + value_op.get("x", 0)
+                value_op["y"] = op["y"] + value_op.get("y", 0)
+                value_ops.append(value_op)
+
+        values = []
+        for op in value_ops:
+            func, kwargs = self._compile_op(op)
+            if "text" in kwargs:
+                text = kwargs.pop("text")
+                getter = text_getter(text)
+                if getter is None:
+                    getter = lambda data, text=text: text
+            else:
+                slot = kwargs.pop("slot")
+                getter = lambda data, slot=slot: slot_value(data, slot)
+            values.append((func, kwargs, getter))
+
+        spellbook = None
+        if "spellbook" in page:
+            spellbook = dict(page["spellbook"])
+            spellbook["y"] = self.page_size[1] - spellbook["y"]
+            continued = spellbook["continued"]
+            spellbook["continued"] = self._compile_page(continued, page_index, suffix="_continued")
+            spellbook["continued_y"] = self.page_size[1] - continued["y"]
+
+        return CompiledPage(f"dc20_{self.name}_page{page_index + 1}{suffix}", template, values,
+                            page.get("bookmark"), spellbook)
+
+    def _compile_op(self, op):
+        kwargs = {key: value for key, value in op.items() if key != "op"}
+        if "y" in kwargs:
+            kwargs["y"] = self.page_size[1] - kwargs["y"]
+        return self.components[op["op"]], kwargs
+
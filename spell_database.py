@@ -0,0 +1,53 @@
+import hashlib
+import json
+import marshal
+import os
+import sys
+from pathlib import Path
+
+SPELL_DATA_FILE = Path(__file__).resolve().parent / "data" / "spells.json"
+
+# Parsed databases by source path, so each file is loaded at most once per process
+_loaded_databases = {}
+
+
+def load_spell_database(path=SPELL_DATA_FILE):
+    """Load the spell database from a JSON data file.
+
+    The returned dict is shared by every caller in the process and must be
+    treated as read-only.
+    """
+    path = Path(path).resolve()
+    database = _loaded_databases.get(path)
+    if database is None:
+        database = _loaded_databases[path] = _load_with_cache(path)
+    return database
+
+
+def _cache_file(path, digest):
+    """Compiled cache location for a data file, keyed by its content hash and interpreter"""
+    return path.parent / "__pycache__" / f"{path.stem}.{sys.implementation.cache_tag}.{digest[:16]}.marshal"
+
+
+def _load_with_cache(path):
+    """Parse a spell data file, reusing a marshal cache when the source is unchanged"""
+    source = path.read_bytes()
+    cache_file = _cache_file(path, hashlib.sha256(source).hexdigest())
+
+    try:
+        return marshal.loads(cache_file.read_bytes())
+    except (OSError, ValueError, EOFError, TypeError):
+        pass
+
+    database = json.loads(source)
+    try:
+        cache_file.parent.mkdir(exist_ok=True)
+        # Drop caches compiled from earlier versions of this file
+        for stale in cache_file.parent.glob(f"{path.stem}.{sys.implementation.cache_tag}.*.marshal"):
+            stale.unlink()
+        tmp_file = cache_file.with_name(cache_file.name + f".{os.getpid()}.tmp")
+        tmp_file.write_bytes(marshal.dumps(database))
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"Could not write spell database cache: {e}")
+    return database
@@ -0,0 +1,85 @@
+import bisect
+import re
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Spell fields whose text is searchable, besides the spell name
+SEARCH_FIELDS = ("school", "range", "duration", "description")
+FACETS = ("level", "school", "casting_time")
+
+# Most prefixes whose matches are kept; the oldest is dropped past this
+PREFIX_CACHE_SIZE = 256
+
+
+def tokenize(text):
+    """Split text into lowercase alphanumeric search tokens"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class SpellSearchIndex:
+    """Inverted index over a spell database with prefix matching and facet filters.
+
+    Built once per spell database; queries only touch the postings of the
+    tokens that match, so they stay fast for catalogs of thousands of spells.
+    """
+
+    def __init__(self, spell_database):
+        self.postings = {}
+        self.facets = {facet: {} for facet in FACETS}
+
+        for spell_name, spell_data in spell_database.items():
+            texts = [spell_name] + [str(spell_data.get(field, "")) for field in SEARCH_FIELDS]
+            for text in texts:
+                for token in tokenize(text):
+                    self.postings.setdefault(token, set()).add(spell_name)
+            for facet, values in self.facets.items():
+                values.setdefault(spell_data.get(facet), set()).add(spell_name)
+
+        self.tokens = sorted(self.postings)
+        self.all_spells = frozenset(spell_database)
+        self._prefix_cache = {}
+
+    def facet_values(self, facet):
+        """Sorted distinct values of a facet, for filter widgets"""
+        return sorted(value for value in self.facets[facet] if value is not None)
+
+    def prefix_matches(self, prefix):
+        """All spells containing a token that starts with prefix"""
+        matches = self._prefix_cache.get(prefix)
+        if matches is None:
+            found = set()
+            i = bisect.bisect_left(self.tokens, prefix)
+            while i < len(self.tokens) and self.tokens[i].startswith(prefix):
+                found |= self.postings[self.tokens[i]]
+                i += 1
+            if len(self._prefix_cache) >= PREFIX_CACHE_SIZE:
+                del self._prefix_cache[next(iter(self._prefix_cache))]
+            matches = self._prefix_cache[prefix] = frozenset(found)
+        return matches
+
+    def search(self, query="", level=None, school=None, casting_time=None, candidates=None):
+        """Find spells matching every query term and facet.
+
+        Each query term matches as a prefix of any word in the name, school,
+        range, duration or description. Facets left as None are not filtered.
+        With candidates, results keep the candidates' order; otherwise they
+        are sorted by name.
+        """
+        result = None
+        for facet, value in (("level", level), ("school", school), ("casting_time", casting_time)):
+            if value is not None:
+                matches = self.facets[facet].get(value, set())
+                result = matches if result is None else result & matches
+
+        for term in tokenize(query):
+            if result is not None and not result:
+                break
+            matches = self.prefix_matches(term)
+            result = matches if result is None else result & matches
+
+        if result is None:
+            result = self.all_spells
+
+        if candidates is not None:
+            return [spell_name for spell_name in candidates if spell_name in result]
+        return sorted(result)
@@ -0,0 +1,243 @@
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+
+class SQLiteCharacterStore:
+    """Character storage backed by a single SQLite file.
+
+    Offers the same save/load/list/delete surface as FileManager, so it can be
+    handed to CharacterCreatorUI in its place. Characters are keyed by their
+    exact name, which avoids the filename collisions of the JSON layout.
+    """
+
+    def __init__(self, db_path="characters.db"):
+        self.db_path = Path(db_path)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS characters (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE,
+                class TEXT NOT NULL DEFAULT '',
+                level INTEGER NOT NULL DEFAULT 1,
+                data TEXT NOT NULL,
+                updated REAL NOT NULL
+            )
+        """)
+        # Autosaved edits not yet written to characters, one full record each
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS autosave_journal (
+                id INTEGER PRIMARY KEY,
+                data TEXT NOT NULL
+            )
+        """)
+        self.conn.commit()
+        # The latest journaled character, the name loaded in this session and
+        # the names autosave inserted (the only rows, besides the loaded one,
+        # that it may overwrite or delete)
+        self._autosave_last = None
+        self._autosave_loaded = None
+        self._autosave_created = set()
+        self.recover_journal()
+
+    def _row(self, data):
+        """Build the parameter tuple stored for one character"""
+        return (
+            data.get("Name", "Character"),
+            data.get("Class", ""),
+            int(data.get("Level", 1) or 1),
+            json.dumps(data, separators=(",", ":")),
+            time.time(),
+        )
+
+    _UPSERT = """
+        INSERT INTO characters (name, class, level, data, updated) VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(name) DO UPDATE SET
+            class = excluded.class, level = excluded.level,
+            data = excluded.data, updated = excluded.updated
+    """
+
+    def save_character_data(self, data):
+        """Save character data, replacing any character with the same name"""
+        try:
+            with self.conn:
+                self.conn.execute(self._UPSERT, self._row(data))
+            # A saved row is the user's: no later rename may delete it
+            self._autosave_created.discard(data.get("Name", "Character"))
+            print(f"Character data saved to {self.db_path}")
+            return True
+        except Exception as e:
+            print(f"Error saving character data: {e}")
+            return False
+
+    def save_many(self, characters, batch_size=1000):
+        """Save an iterable of character dicts in batched transactions, returning the count saved"""
+        saved = 0
+        batch = []
+        try:
+            for data in characters:
+                batch.append(self._row(data))
+                if len(batch) >= batch_size:
+                    with self.conn:
+                        self.conn.executemany(self._UPSERT, batch)
+                    saved += len(batch)
+                    batch = []
+            if batch:
+                with self.conn:
+                    self.conn.executemany(self._UPSERT, batch)
+                saved += len(batch)
+        except Exception as e:
+            print(f"Error saving character data: {e}")
+        return saved
+
+    def autosave_character_data(self, data):
+        """Record an edit in the autosave_journal table, returning True if anything was recorded.
+
+        Each edit is one committed insert, so it survives a crash; the
+        character row itself is only written by compact_journal.
+        """
+        data = json.loads(json.dumps(data))
+        data["Name"] = self._autosave_target(data.get("Name", "Character"))
+        if data == self._autosave_last:
+            return False
+        try:
+            with self.conn:
+                self.conn.execute("INSERT INTO autosave_journal (data) VALUES (?)",
+                                  (json.dumps(data, separators=(",", ":")),))
+        except sqlite3.Error as e:
+            print(f"Error writing autosave journal: {e}")
+            return False
+        self._autosave_last = data
+        return True
+
+    def _autosave_target(self, base_name):
+        """Name to autosave a character as, never one this session didn't load or create.
+
+        A name that belongs to another stored character is autosaved as
+        "<name> (autosave)", "<name> (autosave 2)", ... instead of over it.
+        """
+        name = base_name
+        attempt = 0
+        while name != self._autosave_loaded and name not in self._autosave_created:
+            if self.conn.execute("SELECT 1 FROM characters WHERE name = ?", (name,)).fetchone() is None:
+                self._autosave_created.add(name)
+                break
+            attempt += 1
+            name = f"{base_name} (autosave)" if attempt == 1 else f"{base_name} (autosave {attempt})"
+        return name
+
+    def compact_journal(self):
+        """Write the latest journaled edit and empty the journal in one transaction.
+
+        Rows of names the character was autosaved under before are dropped
+        in the same transaction. Returns False if the write failed.
+        """
+        try:
+            row = self.conn.execute("SELECT data FROM autosave_journal ORDER BY id DESC LIMIT 1").fetchone()
+            if row is None:
+                return True
+            data = json.loads(row[0])
+            name = data.get("Name", "Character")
+            with self.conn:
+                self.conn.execute(self._UPSERT, self._row(data))
+                for old_name in self._autosave_created - {name}:
+                    self.conn.execute("DELETE FROM characters WHERE name = ?", (old_name,))
+                self.conn.execute("DELETE FROM autosave_journal")
+            self._autosave_created &= {name}
+            return True
+        except (sqlite3.Error, ValueError) as e:
+            print(f"Error compacting autosave journal: {e}")
+            return False
+
+    def recover_journal(self):
+        """Write the edits journaled by a session that crashed before compacting.
+
+        Only the names created since opening are ever dropped, so a crashed
+        session's characters are kept whatever their name.
+        """
+        self.compact_journal()
+
+    def start_autosave_session(self, data=None, character_ref=None):
+        """Write the journaled edits before another character is edited.
+
+        data is the loaded character as the editor holds it; rows are keyed
+        by its name, so character_ref is only accepted for parity with
+        FileManager.
+        """
+        self.compact_journal()
+        self._autosave_created.clear()
+        self._autosave_last = self._autosave_loaded = None
+        if data is not None:
+            self._autosave_last = json.loads(json.dumps(data))
+            self._autosave_loaded = self._autosave_last.get("Name", "Character")
+
+    def load_character_data(self, character_id):
+        """Load character data by the id returned from get_available_characters"""
+        try:
+            row = self.conn.execute("SELECT data FROM characters WHERE id = ?", (int(character_id),)).fetchone()
+            return json.loads(row[0]) if row else None
+        except Exception as e:
+            print(f"Error loading character data: {e}")
+            return None
+
+    def find_character(self, character_name):
+        """Load character data by exact name"""
+        try:
+            row = self.conn.execute("SELECT data FROM characters WHERE name = ?", (character_name,)).fetchone()
+            return json.loads(row[0]) if row else None
+        except Exception as e:
+            print(f"Error loading character data: {e}")
+            return None
+
+    def get_available_characters(self):
+        """Get list of (name, id) pairs for every stored character"""
+        return self.conn.execute("SELECT name, id FROM characters ORDER BY name").fetchall()
+
+    def iter_available_characters(self, batch_size=500):
+        """Yield lists of (name, id) pairs, reading through a connection of the calling thread.
+
+        SQLite connections are tied to the thread that opened them, so this
+        can stream the roster from a background thread.
+        """
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            cursor = conn.execute("SELECT name, id FROM characters")
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            conn.close()
+
+    def delete_character(self, character_name):
+        """Delete a character by name"""
+        try:
+            with self.conn:
+                cursor = self.conn.execute("DELETE FROM characters WHERE name = ?", (character_name,))
+            return cursor.rowcount > 0
+        except Exception as e:
+            print(f"Error deleting character: {e}")
+        return False
+
+    def import_directory(self, characters_dir="characters", batch_size=1000):
+        """Import every character JSON file from a FileManager directory, returning the count imported"""
+        def read_characters():
+            for json_file in sorted(Path(characters_dir).glob("*.json")):
+                try:
+                    with open(json_file, 'r') as f:
+                        data = json.load(f)
+                except (OSError, ValueError) as e:
+                    print(f"Skipping {json_file}: {e}")
+                    continue
+                if isinstance(data, dict) and "Name" in data:
+                    yield data
+
+        return self.save_many(read_characters(), batch_size)
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
@@ -0,0 +1,74 @@
+"""Check that the character creator still starts fast.
+
+Run with "python startup_budget.py". Each measurement runs in a fresh
+interpreter so nothing is already imported. Exits non-zero if any budget
+is exceeded or a module that should load lazily is imported at startup.
+"""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+# Milliseconds, generous enough for a slow laptop with a cold disk cache
+IMPORT_BUDGET_MS = 150
+STARTUP_BUDGET_MS = 500
+
+# Modules the app should only import on first use
+LAZY_MODULES = ["reportlab", "pdf_generator", "export_worker", "spell_search"]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import character_data, file_manager, ui_components
+result = {"import_ms": (time.perf_counter() - start) * 1000}
+try:
+    import tkinter as tk
+    root = tk.Tk()
+except tk.TclError:
+    result["startup_ms"] = None
+else:
+    root.withdraw()
+    start = time.perf_counter()
+    ui_components.CharacterCreatorUI(root, character_data.CharacterData(), file_manager.FileManager())
+    root.update_idletasks()
+    result["startup_ms"] = (time.perf_counter() - start) * 1000
+    root.destroy()
+result["loaded"] = sorted(name for name in sys.modules if name.split(".")[0] in %r)
+print(json.dumps(result))
+"""
+
+
+def measure():
+    """Import and UI construction times of a fresh interpreter, plus any lazy modules it loaded"""
+    app_dir = Path(__file__).resolve().parent
+    probe = f"import sys; sys.path.insert(0, {str(app_dir)!r})\n" + _PROBE % (LAZY_MODULES,)
+    output = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True,
+                            check=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main():
+    result = measure()
+    failures = []
+
+    print(f"Import time: {result['import_ms']:.1f} ms (budget {IMPORT_BUDGET_MS} ms)")
+    if result["import_ms"] > IMPORT_BUDGET_MS:
+        failures.append("import time over budget")
+
+    if result["startup_ms"] is None:
+        print("Startup time: skipped, no display available")
+    else:
+        print(f"Startup time: {result['startup_ms']:.1f} ms (budget {STARTUP_BUDGET_MS} ms)")
+        if result["startup_ms"] > STARTUP_BUDGET_MS:
+            failures.append("startup time over budget")
+
+    if result["loaded"]:
+        failures.append("loaded at startup: " + ", ".join(result["loaded"]))
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from file_manager import FileManager
+
+
+class AutosaveJournalTest(unittest.TestCase):
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        self.manager = FileManager()
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def test_rename_drops_autosaved_file(self):
+        self.manager.autosave_character_data({"Name": "Alice", "Level": 1})
+        self.manager.compact_journal()
+        self.manager.autosave_character_data({"Name": "Bob", "Level": 1})
+        self.manager.compact_journal()
+
+        self.assertFalse(Path("characters/Alice.json").exists())
+        self.assertTrue(Path("characters/Bob.json").exists())
+
+    def test_rename_keeps_explicitly_saved_file(self):
+        self.manager.autosave_character_data({"Name": "Alice", "Level": 1})
+        self.manager.compact_journal()
+        self.manager.save_character_data({"Name": "Alice", "Level": 2})
+        self.manager.autosave_character_data({"Name": "Bob", "Level": 2})
+        self.manager.compact_journal()
+
+        self.assertEqual(self.manager.load_character_data(Path("characters/Alice.json"))["Level"], 2)
+        self.assertTrue(Path("characters/Bob.json").exists())
+
+    def test_autosave_writes_to_loaded_file(self):
+        json_file = Path("characters/alice_old.json")
+        self.manager._write_character_file(json_file, {"Name": "Alice", "Level": 1})
+        self.manager.start_autosave_session({"Name": "Alice", "Level": 1}, str(json_file))
+        self.assertFalse(self.manager.autosave_character_data({"Name": "Alice", "Level": 1}))
+        self.manager.autosave_character_data({"Name": "Alice", "Level": 2})
+        self.manager.compact_journal()
+
+        self.assertEqual(self.manager.load_character_data(json_file)["Level"], 2)
+        self.assertFalse(Path("characters/Alice.json").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
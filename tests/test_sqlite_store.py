@@ -0,0 +1,49 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlite_store import SQLiteCharacterStore
+
+
+class AutosaveTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.store = SQLiteCharacterStore(Path(self._tmp.name) / "characters.db")
+
+    def tearDown(self):
+        self.store.close()
+        self._tmp.cleanup()
+
+    def names(self):
+        return [name for name, _ in self.store.get_available_characters()]
+
+    def test_rename_drops_autosaved_row(self):
+        self.store.autosave_character_data({"Name": "Alice"})
+        self.store.compact_journal()
+        self.store.autosave_character_data({"Name": "Bob"})
+        self.store.compact_journal()
+
+        self.assertEqual(self.names(), ["Bob"])
+
+    def test_rename_keeps_explicitly_saved_row(self):
+        self.store.autosave_character_data({"Name": "Alice"})
+        self.store.compact_journal()
+        self.store.save_character_data({"Name": "Alice"})
+        self.store.autosave_character_data({"Name": "Bob"})
+        self.store.compact_journal()
+
+        self.assertEqual(self.names(), ["Alice", "Bob"])
+
+    def test_journal_survives_crash(self):
+        self.store.autosave_character_data({"Name": "Alice", "Level": 3})
+        self.store.conn.close()  # Crash before the journal is compacted
+
+        self.store = SQLiteCharacterStore(Path(self._tmp.name) / "characters.db")
+        self.assertEqual(self.store.find_character("Alice"), {"Name": "Alice", "Level": 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
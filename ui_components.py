@@ -1,24 +1,73 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from character_picker import CharacterPicker
+
+# Journaled autosaves are written to the character file once edits pause this long
+AUTOSAVE_QUIET_MS = 2000
+
 
 class CharacterCreatorUI:
-    def __init__(self, root, character_data, file_manager, pdf_generator):
+    """Main window of the character creator.
+
+    Startup only builds what the first screen shows: reportlab is imported
+    with the PDF generator on the first preview or export, the spell section
+    is built the first time a spellcasting class is chosen, and the roster is
+    scanned on a background thread once the window is up.
+    """
+
+    def __init__(self, root, character_data, file_manager, pdf_generator=None):
         self.root = root
         self.character_data = character_data
         self.file_manager = file_manager
-        self.pdf_generator = pdf_generator
+        self._pdf_generator = pdf_generator
         self.remaining_display = None
+        self.character_picker = None
         self.spell_frame = None
         self.spell_listbox = None
         self.available_spells_listbox = None
+        self.spell_filter_var = tk.StringVar()
+        self.spell_facet_vars = {}
+        self.preview_window = None
+        self.preview_canvas = None
+        self.preview_label = None
+        self.preview_page = 0
+        self.preview_scale = 0.75
+        # Skill value entries and the training level each one is colored for
+        self.skill_entries = {}
+        self._entry_levels = {}
+        self._refresh_job = None
+        self._compact_job = None
+        self._export_worker = None
+        self.export_progress = None
+        self.export_status = None
+        self.cancel_export_button = None
 
         self.create_ui()
+        self.character_data.trace_inputs(self.schedule_refresh)
 
         # Initialize
-        self.character_data.calculate_skills()
-        self.character_data.update_remaining_skill_slots(self.remaining_display)
-        self.populate_character_dropdown()
+        self.refresh()
+        self.root.after_idle(self.refresh_character_list)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    @property
+    def pdf_generator(self):
+        """The sheet renderer, importing reportlab on first use"""
+        if self._pdf_generator is None:
+            from pdf_generator import PDFGenerator
+            self._pdf_generator = PDFGenerator()
+        return self._pdf_generator
+
+    @property
+    def export_worker(self):
+        """Background exporter, started with the first export"""
+        if self._export_worker is None:
+            from export_worker import ExportWorker
+            self._export_worker = ExportWorker(self.root, self.pdf_generator, self.file_manager,
+                                               self.character_data.spell_database,
+                                               on_update=self.update_export_status)
+        return self._export_worker
 
     def create_ui(self):
         """Create the main user interface"""
@@ -37,8 +86,7 @@ class CharacterCreatorUI:
         # Skills Section
         self.create_skills_section()
 
-        # Spells Section (initially hidden)
-        self.create_spells_section()
+        # Spells Section is built by update_spell_section on first use
 
         # Final Button
         self.create_final_button()
@@ -52,12 +100,14 @@ class CharacterCreatorUI:
         char_load_frame = ttk.Frame(load_frame)
         char_load_frame.pack(pady=5)
 
-        self.character_dropdown = ttk.Combobox(char_load_frame, textvariable=self.character_data.character_var,
-                                               width=30, state="readonly")
-        self.character_dropdown.pack(side="left", padx=5)
+        self.character_picker = CharacterPicker(char_load_frame, rows=5, width=30,
+                                                on_activate=self.load_selected_character)
+        self.character_picker.pack(side="left", padx=5)
 
-        ttk.Button(char_load_frame, text="Load", command=self.load_selected_character).pack(side="left", padx=5)
-        ttk.Button(char_load_frame, text="Refresh", command=self.refresh_character_list).pack(side="left", padx=5)
+        button_frame = ttk.Frame(char_load_frame)
+        button_frame.pack(side="left", padx=5)
+        ttk.Button(button_frame, text="Load", command=self.load_selected_character).pack(pady=2)
+        ttk.Button(button_frame, text="Refresh", command=self.refresh_character_list).pack(pady=2)
 
         ttk.Separator(self.root, orient="horizontal").pack(fill="x", pady=10)
 
@@ -185,29 +235,15 @@ class CharacterCreatorUI:
                                   width=5, state="readonly")
                 entry.pack()
 
-                def create_update_function(skill_name, entry_widget):
-                    def update_entry_bg(*args):
-                        level = self.character_data.skill_trainings[skill_name].get()
-                        if level == "Expert":
-                            entry_widget.configure(background="#d1e7dd")
-                        elif level == "Trained":
-                            entry_widget.configure(background="#fff3cd")
-                        else:
-                            entry_widget.configure(background="white")
-
-                    return update_entry_bg
-
-                update_func = create_update_function(skill, entry)
-                self.character_data.skill_trainings[skill].trace_add("write", update_func)
-                update_func()
+                self.skill_entries[skill] = entry
 
+                # Changing the training writes through a trace, which schedules a refresh
                 combo = ttk.Combobox(skill_frame, textvariable=self.character_data.skill_trainings[skill],
                                      values=list(self.character_data.training_bonus.keys()), width=8, state="readonly")
                 combo.pack()
-                combo.bind("<<ComboboxSelected>>", lambda e: self.calculate_skills_wrapper())
 
     def create_spells_section(self):
-        """Create the spells section (initially hidden)"""
+        """Create the spells section (hidden until packed by update_spell_section)"""
         self.spell_frame = ttk.Frame(self.root)
         # Don't pack initially - will be shown/hidden based on class
 
@@ -224,6 +260,25 @@ class CharacterCreatorUI:
 
         ttk.Label(available_frame, text="Available Spells", font=("Helvetica", 10, "bold")).pack()
 
+        # Search box and facet filters
+        filter_frame = ttk.Frame(available_frame)
+        filter_frame.pack(fill="x", pady=2)
+        ttk.Label(filter_frame, text="Filter:").pack(side="left")
+        ttk.Entry(filter_frame, textvariable=self.spell_filter_var, width=14).pack(side="left", fill="x", expand=True)
+        self.spell_filter_var.trace_add("write", lambda *args: self.update_available_spells())
+
+        facet_frame = ttk.Frame(available_frame)
+        facet_frame.pack(fill="x", pady=2)
+        spell_search = self.character_data.spell_search
+        for facet, label, width in (("level", "Lvl", 3), ("school", "School", 11), ("casting_time", "Time", 9)):
+            facet_var = tk.StringVar(value="Any")
+            self.spell_facet_vars[facet] = facet_var
+            ttk.Label(facet_frame, text=label).pack(side="left")
+            facet_combo = ttk.Combobox(facet_frame, textvariable=facet_var, state="readonly", width=width,
+                                       values=["Any"] + [str(v) for v in spell_search.facet_values(facet)])
+            facet_combo.pack(side="left", padx=(0, 4))
+            facet_combo.bind("<<ComboboxSelected>>", lambda e: self.update_available_spells())
+
         # Scrollable listbox for available spells
         available_scroll_frame = ttk.Frame(available_frame)
         available_scroll_frame.pack(fill="both", expand=True)
@@ -268,9 +323,11 @@ class CharacterCreatorUI:
         level = int(self.character_data.level_var.get()) if self.character_data.level_var.get() else 1
 
         if self.character_data.is_spellcaster():
+            if self.spell_frame is None:
+                self.create_spells_section()
             self.spell_frame.pack(fill="both", expand=True)
             self.update_available_spells()
-        else:
+        elif self.spell_frame is not None:
             self.spell_frame.pack_forget()
 
     def update_available_spells(self):
@@ -283,6 +340,14 @@ class CharacterCreatorUI:
 
         available_spells = self.character_data.get_spells_for_class(class_name, level)
 
+        # Narrow by the search box and facet filters
+        query = self.spell_filter_var.get()
+        facets = {facet: var.get() for facet, var in self.spell_facet_vars.items() if var.get() != "Any"}
+        if "level" in facets:
+            facets["level"] = int(facets["level"])
+        if query.strip() or facets:
+            available_spells = self.character_data.spell_search.search(query, candidates=available_spells, **facets)
+
         self.available_spells_listbox.delete(0, tk.END)
         for spell in available_spells:
             spell_data = self.character_data.spell_database[spell]
@@ -311,6 +376,7 @@ class CharacterCreatorUI:
             spell_name = spell_text.split(" (Lvl")[0]  # Extract spell name
             self.character_data.add_spell(spell_name)
             self.update_selected_spells()
+            self.schedule_refresh()
 
     def remove_spell(self):
         """Remove selected spell from character's spell list"""
@@ -320,6 +386,7 @@ class CharacterCreatorUI:
             spell_name = spell_text.split(" (Lvl")[0]  # Extract spell name
             self.character_data.remove_spell(spell_name)
             self.update_selected_spells()
+            self.schedule_refresh()
 
     def view_spell(self):
         """View spell details in a popup"""
@@ -372,45 +439,158 @@ class CharacterCreatorUI:
     def create_final_button(self):
         """Create the final submit button"""
         ttk.Separator(self.root, orient="horizontal").pack(fill="x", pady=10)
-        create_button = ttk.Button(self.root, text="Create Character Sheet (PDF)",
+        button_frame = ttk.Frame(self.root)
+        button_frame.pack(pady=15)
+        ttk.Button(button_frame, text="Preview Sheet", command=self.open_preview).pack(side="left", padx=5)
+        create_button = ttk.Button(button_frame, text="Create Character Sheet (PDF)",
                                    command=self.submit_character)
-        create_button.pack(pady=15)
+        create_button.pack(side="left", padx=5)
+
+        # Export queue status
+        status_frame = ttk.Frame(self.root)
+        status_frame.pack(pady=(0, 10))
+        self.export_progress = ttk.Progressbar(status_frame, length=200, mode="determinate")
+        self.export_progress.pack(side="left", padx=5)
+        self.export_status = ttk.Label(status_frame, text="", width=40)
+        self.export_status.pack(side="left", padx=5)
+        self.cancel_export_button = ttk.Button(status_frame, text="Cancel", state="disabled",
+                                               command=lambda: self.export_worker.cancel())
+        self.cancel_export_button.pack(side="left", padx=5)
+
+    def open_preview(self):
+        """Open the live sheet preview window, or raise it if already open"""
+        if self.preview_window is not None:
+            self.preview_window.lift()
+            return
+
+        width, height = self.pdf_generator.layout.page_size
+        self.preview_window = tk.Toplevel(self.root)
+        self.preview_window.title("Sheet Preview")
+        self.preview_window.protocol("WM_DELETE_WINDOW", self.close_preview)
+
+        controls = ttk.Frame(self.preview_window)
+        controls.pack(fill="x", padx=5, pady=5)
+        ttk.Button(controls, text="◀ Prev", command=lambda: self.turn_preview_page(-1)).pack(side="left")
+        ttk.Button(controls, text="Next ▶", command=lambda: self.turn_preview_page(1)).pack(side="left", padx=5)
+        self.preview_label = ttk.Label(controls)
+        self.preview_label.pack(side="left", padx=10)
+
+        self.preview_canvas = tk.Canvas(self.preview_window, width=width * self.preview_scale,
+                                        height=height * self.preview_scale, bg="white", highlightthickness=0)
+        self.preview_canvas.pack()
+        self.preview_page = 0
+        self.render_preview()
+
+    def close_preview(self):
+        """Close the preview window"""
+        self.preview_window.destroy()
+        self.preview_window = self.preview_canvas = self.preview_label = None
+
+    def turn_preview_page(self, delta):
+        """Show the previous or next page of the preview"""
+        self.preview_page += delta
+        self.render_preview()
+
+    def render_preview(self, data=None):
+        """Draw the current character onto the preview canvas, entirely in memory"""
+        if self.preview_window is None:
+            return
+        if data is None:
+            try:
+                data = self.character_data.model.get_character_data()
+            except ValueError:
+                return  # Keep the last good preview while a field is half typed
+        page_total = self.pdf_generator.draw_preview(self.preview_canvas, data, self.preview_page, self.preview_scale,
+                                                     spell_database=self.character_data.spell_database)
+        self.preview_page = min(max(self.preview_page, 0), page_total - 1)
+        self.preview_label.config(text=f"Page {self.preview_page + 1} of {page_total}")
 
     def update_attributes_wrapper(self, attr_name, delta):
         """Wrapper for updating attributes"""
         self.character_data.update_attributes(attr_name, delta)
-        self.character_data.update_remaining_skill_slots(self.remaining_display)
 
     def reset_skill_trainings_wrapper(self):
         """Wrapper for resetting skill trainings"""
         self.character_data.reset_skill_trainings()
-        self.character_data.update_remaining_skill_slots(self.remaining_display)
 
-    def calculate_skills_wrapper(self):
-        """Wrapper for calculating skills"""
+    def schedule_refresh(self):
+        """Mark derived values dirty, to be recomputed once when Tk is next idle.
+
+        Input traces call this on every write, so a held-down button or a
+        bulk load costs one recompute per idle cycle rather than one per change.
+        """
+        if self._refresh_job is None:
+            self._refresh_job = self.root.after_idle(self.refresh)
+
+    def refresh(self):
+        """Recompute derived values and redraw everything that shows them"""
+        self._refresh_job = None
         self.character_data.calculate_skills()
         self.character_data.update_remaining_skill_slots(self.remaining_display)
+        self.update_skill_entry_colors()
+        try:
+            data = self.character_data.model.get_character_data()
+        except ValueError:
+            return  # Keep the last good preview and autosave while a field is half typed
+        self.autosave(data)
+        self.render_preview(data)
 
-    def populate_character_dropdown(self):
-        """Update the character dropdown with available characters"""
-        characters = self.file_manager.get_available_characters()
-        character_names = [name for name, _ in characters]
-        self.character_dropdown['values'] = character_names
-        return dict(characters)
-
-    def load_selected_character(self):
-        """Load the selected character from dropdown"""
-        selected_name = self.character_data.character_var.get()
-        if not selected_name:
+    def autosave(self, data):
+        """Journal the character's latest edits and compact once they go quiet"""
+        if not data["Name"].strip() or not self.file_manager.autosave_character_data(data):
             return
+        if self._compact_job is not None:
+            self.root.after_cancel(self._compact_job)
+        self._compact_job = self.root.after(AUTOSAVE_QUIET_MS, self.compact_autosave)
+
+    def compact_autosave(self):
+        """Fold the autosave journal into the character files"""
+        self._compact_job = None
+        self.file_manager.compact_journal()
+
+    def on_close(self):
+        """Finish or cancel queued exports and write pending autosaves before the window closes"""
+        if self._export_worker is not None:
+            pending = len(self._export_worker.pending())
+            finish = False
+            if pending:
+                finish = messagebox.askyesnocancel(
+                    "Exports Pending",
+                    f"{pending} character sheet(s) are still exporting. Finish them before closing?\n\n"
+                    "Choose No to cancel them.")
+                if finish is None:
+                    return
+            self._export_worker.on_update = None
+            self._export_worker.shutdown(finish=finish)
+
+        if self._compact_job is not None:
+            self.root.after_cancel(self._compact_job)
+            self._compact_job = None
+        self.file_manager.compact_journal()
+        self.root.destroy()
+
+    def update_skill_entry_colors(self):
+        """Color each skill entry by its training level, touching only changed entries"""
+        for skill, entry in self.skill_entries.items():
+            level = self.character_data.skill_trainings[skill].get()
+            if self._entry_levels.get(skill) == level:
+                continue
+            self._entry_levels[skill] = level
+            if level == "Expert":
+                entry.configure(background="#d1e7dd")
+            elif level == "Trained":
+                entry.configure(background="#fff3cd")
+            else:
+                entry.configure(background="white")
 
-        character_map = self.populate_character_dropdown()
-        if selected_name not in character_map:
-            messagebox.showerror("Error", "Character not found!")
+    def load_selected_character(self):
+        """Load the character selected in the picker"""
+        selected = self.character_picker.selection()
+        if not selected:
             return
 
-        json_file = character_map[selected_name]
-        data = self.file_manager.load_character_data(json_file)
+        _, character_ref = selected
+        data = self.file_manager.load_character_data(character_ref)
 
         if not data:
             messagebox.showerror("Error", "Failed to load character data!")
@@ -418,25 +598,44 @@ class CharacterCreatorUI:
 
         try:
             self.character_data.load_character_data(data)
-            self.character_data.update_remaining_skill_slots(self.remaining_display)
+            # Seed the autosave with the data as the editor holds it, so
+            # loading alone never rewrites the file
+            self.file_manager.start_autosave_session(self.character_data.model.get_character_data(),
+                                                     character_ref)
             self.update_spell_section()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load character: {e}")
 
     def refresh_character_list(self):
-        """Refresh the character dropdown list"""
-        self.populate_character_dropdown()
-        self.character_data.character_var.set("")
+        """Rescan saved characters into the picker in the background"""
+        self.character_picker.start_scan(self.file_manager.iter_available_characters)
 
     def submit_character(self):
-        """Submit character and create PDF"""
+        """Queue the character's PDF export and save on the background worker"""
         try:
             data = self.character_data.get_character_data()
-            self.pdf_generator.export_to_pdf(data, self.character_data)
-            self.file_manager.save_character_data(data)
-            messagebox.showinfo("Character Created",
-                                f"Character PDF saved as {data.get('Name', 'Character')}.pdf")
         except ValueError:
             messagebox.showerror("Input Error", "Make sure all fields are filled out correctly.")
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred: {e}")
\ No newline at end of file
+            return
+        job = self.export_worker.submit(data)
+        self.update_export_status(job)
+
+    def update_export_status(self, job):
+        """Show export queue progress after a job changes state"""
+        finished, total = self.export_worker.progress()
+        self.export_progress.configure(maximum=max(total, 1), value=finished)
+
+        pending = self.export_worker.pending()
+        if pending:
+            current = pending[0]
+            verb = "Exporting" if current.state == "rendering" else "Queued"
+            self.export_status.configure(text=f"{verb} {current.name} ({finished + 1} of {total})")
+        elif job.state == "done":
+            self.export_status.configure(text=f"Character PDF saved as {job.file_name}")
+        elif job.state == "cancelled":
+            self.export_status.configure(text="Export cancelled")
+        self.cancel_export_button.configure(state="normal" if pending else "disabled")
+
+        if job.state == "failed":
+            self.export_status.configure(text=f"Export of {job.name} failed")
+            messagebox.showerror("Error", f"An error occurred exporting {job.name}: {job.error}")
\ No newline at end of file